@@ -7,58 +7,118 @@ from datetime import datetime
 import os
 import threading
 import time
-
-from bot.core.models import BotMode, BotSettings, ExecutionMode, SlideDirection, StopReason, TradeOutcome, TradeSignal
+from typing import Callable
+
+from bot.core.models import (
+    BotMode,
+    BotSettings,
+    ExecutionMode,
+    LifecycleState,
+    SlideDirection,
+    StopReason,
+    TradeOutcome,
+    TradeSignal,
+)
 from bot.core.otc_pair_manager import OTCPairManager
 from bot.core.session_engine import SessionEngine
 from bot.core.settings_manager import SettingsManager
 from bot.core.strategy_engine import StrategyEngine
-from bot.execution.factory import build_adapter
+from bot.execution.adapters import BrokerAdapter
+from bot.execution.factory import build_adapter, release_adapters
 from bot.execution.pocket_option_selenium import PocketOptionSeleniumAdapter
 from bot.licensing.device import get_device_model
 from bot.licensing.validator import LicenseValidator
 from bot.storage.journal import Journal
 
 
+_ACTIVATION_PAYLOAD_TEMPLATE = '{"device_id":%s,"device_model":%s}'
+
+
 class BotController:
     def __init__(self, project_root: Path) -> None:
         self.project_root = project_root
         self.settings_manager = SettingsManager(self.project_root / "profiles")
         self.settings = self.settings_manager.load_last_used()
+        self._primary_pair = self._resolve_primary_pair(self.settings)
         self.session = SessionEngine(self.settings)
         self.pair_manager = OTCPairManager(self.settings)
         self.strategy = StrategyEngine(self.settings, self.pair_manager)
-        self.execution_adapter = build_adapter(self.settings)
+        # Adapters are kept per execution mode so switching back to broker mode
+        # reuses the same browser session instead of starting another one.
+        self._adapters: dict[ExecutionMode, BrokerAdapter] = {}
+        self.execution_adapter = build_adapter(self.settings, self._adapters)
+        self._refresh_adapter_caps()
         self.license_validator = LicenseValidator(self.project_root)
         self.journal = Journal(self.project_root / "data" / "journal.db")
         self.last_signal: TradeSignal | None = None
-        self.last_execution_message = "none"
+        self.on_state_change: list[Callable[[str, str], None]] = []
+        self.attempts_version = 0
+        self._last_execution_message = "none"
         self.last_license_validation = None
         self._auto_trade_thread: threading.Thread | None = None
         self._auto_trade_running = False
+        self._auto_trade_generation = 0
+        self._wake = threading.Event()
         self._oscillate_next_direction = SlideDirection.BUY
+        self._refresh_direction_picker()
         self._next_trade_at = 0.0
         self._trade_cooldown_seconds = 65.0
+        self._take_profit_poll_seconds = 5.0
         self._broker_start_balance: float | None = None
         self._broker_last_balance: float | None = None
+        self._device_id: str | None = None
+        self._device_model: str | None = None
+        self._activation_payload: str | None = None
+        self._activation_bot_username = ""
+        self.reload_env()
+        self._last_journaled_signal_key: tuple[str, SlideDirection, str] | None = None
+        self._last_signal_journaled_at = 0.0
 
     def update_settings(self, settings: BotSettings, profile: str = "default") -> None:
         settings.validate()
-        previous_adapter = self.execution_adapter
+        previous_mode = self.settings.execution_mode
         self.settings = settings
+        self._primary_pair = self._resolve_primary_pair(settings)
         self.settings_manager.save_profile(settings, profile_name=profile)
-        self.session = SessionEngine(self.settings)
-        self.pair_manager = OTCPairManager(self.settings)
-        self.strategy = StrategyEngine(self.settings, self.pair_manager)
+        self.session.apply_settings(settings)
+        self.pair_manager.apply_settings(settings)
+        self.strategy.apply_settings(settings)
+
+        if settings.execution_mode != previous_mode:
+            self.execution_adapter = build_adapter(self.settings, self._adapters)
+            self._refresh_adapter_caps()
+        elif self._selenium_adapter is not None:
+            self._selenium_adapter.settings = settings
+        self._refresh_direction_picker()
+        self._wake.set()
+
+    @staticmethod
+    def _resolve_primary_pair(settings: BotSettings) -> str:
+        return settings.enabled_pairs[0] if settings.enabled_pairs else "OTC"
+
+    @property
+    def last_execution_message(self) -> str:
+        return self._last_execution_message
+
+    @last_execution_message.setter
+    def last_execution_message(self, message: str) -> None:
+        if message == self._last_execution_message:
+            return
+        self._last_execution_message = message
+        self._notify_state_change()
 
-        if (
-            settings.execution_mode == ExecutionMode.BROKER_PLUGIN
-            and isinstance(previous_adapter, PocketOptionSeleniumAdapter)
-        ):
-            previous_adapter.settings = settings
-            self.execution_adapter = previous_adapter
-        else:
-            self.execution_adapter = build_adapter(self.settings)
+    def _notify_state_change(self) -> None:
+        state = self.session.stats.state.value
+        message = self._last_execution_message
+        for callback in list(self.on_state_change):
+            try:
+                callback(state, message)
+            except Exception:
+                pass
+
+    def _refresh_adapter_caps(self) -> None:
+        adapter = self.execution_adapter
+        self._selenium_adapter = adapter if isinstance(adapter, PocketOptionSeleniumAdapter) else None
 
     def start(self) -> str:
         self.session.start()
@@ -66,9 +126,9 @@ class BotController:
         self._broker_start_balance = None
         self._broker_last_balance = None
 
-        if isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
+        if self._selenium_adapter is not None:
             try:
-                bal = self.execution_adapter.get_account_balance()
+                bal = self._selenium_adapter.get_account_balance()
                 if bal is not None:
                     self._broker_start_balance = bal
                     self._broker_last_balance = bal
@@ -76,6 +136,7 @@ class BotController:
                 pass
 
         self._start_auto_trade_loop()
+        self._notify_state_change()
         if self.settings.execution_mode == ExecutionMode.BROKER_PLUGIN and self.settings.auto_open_broker_on_start:
             broker_msg = self.open_broker_session()
             if broker_msg.lower().startswith("failed"):
@@ -83,33 +144,44 @@ class BotController:
         return "Session started"
 
     def pause(self) -> str:
-        if self.session.stats.state.value == "paused":
+        if self.session.stats.state is LifecycleState.PAUSED:
             self.session.resume()
             self._start_auto_trade_loop()
+            self._notify_state_change()
             return "Session resumed"
         self._stop_auto_trade_loop()
         self.session.pause()
+        self._notify_state_change()
         return "Session paused"
 
     def stop(self) -> str:
         self._stop_auto_trade_loop()
         self.session.stop()
         self.journal.log_session(self.session.stats)
+        self._notify_state_change()
         return "Session stopped"
 
+    def shutdown(self) -> None:
+        self._stop_auto_trade_loop()
+        release_adapters(self._adapters)
+        self._selenium_adapter = None
+        self.journal.close()
+
     def record_win(self, pair: str = "OTC") -> str:
         trade = self.session.apply_trade_outcome(TradeOutcome.WIN, pair=pair)
         self.journal.log_trade(trade)
-        if self.session.stats.state.value == "stopped":
+        if self.session.stats.state is LifecycleState.STOPPED:
             self.journal.log_session(self.session.stats)
+            self._notify_state_change()
             return f"WIN logged (+{trade.pnl}). Session stopped: {self.session.stats.stop_reason.value}"
         return f"WIN logged (+{trade.pnl})"
 
     def record_loss(self, pair: str = "OTC") -> str:
         trade = self.session.apply_trade_outcome(TradeOutcome.LOSS, pair=pair)
         self.journal.log_trade(trade)
-        if self.session.stats.state.value == "stopped":
+        if self.session.stats.state is LifecycleState.STOPPED:
             self.journal.log_session(self.session.stats)
+            self._notify_state_change()
             return f"LOSS logged ({trade.pnl}). Session stopped: {self.session.stats.stop_reason.value}"
         return f"LOSS logged ({trade.pnl})"
 
@@ -118,25 +190,42 @@ class BotController:
         if direction is not None:
             self.settings.slide_direction = direction
         self.settings_manager.save_profile(self.settings)
-        self.pair_manager = OTCPairManager(self.settings)
-        self.strategy = StrategyEngine(self.settings, self.pair_manager)
+        self.session.apply_settings(self.settings)
+        self.strategy.apply_settings(self.settings)
+        self._refresh_direction_picker()
 
     def set_execution_mode(self, mode_value: str) -> None:
         self.settings.execution_mode = ExecutionMode(mode_value)
         self.settings_manager.save_profile(self.settings)
-        self.execution_adapter = build_adapter(self.settings)
+        self.execution_adapter = build_adapter(self.settings, self._adapters)
+        self._refresh_adapter_caps()
+        self._wake.set()
 
     def feed_price(self, pair: str, price: float, timestamp: datetime | None = None) -> TradeSignal | None:
         signal = self.strategy.on_price(pair=pair, price=price, timestamp=timestamp)
         if signal is not None:
             self.last_signal = signal
-            self.journal.log_signal(signal)
+            if not self.settings.auto_execute_signals or self.session.stats.state is not LifecycleState.RUNNING:
+                if self._should_journal_signal(signal):
+                    self.journal.log_signal(signal)
             if self.settings.auto_execute_signals:
-                self.last_execution_message = self.execute_last_signal()
+                self.last_execution_message = self.execute_last_signal(now=signal.timestamp)
         return signal
 
-    def execute_last_signal(self) -> str:
-        if self.session.stats.state.value != "running":
+    def _should_journal_signal(self, signal: TradeSignal) -> bool:
+        interval = self.settings.min_signal_log_interval_s
+        if interval <= 0:
+            return True
+        key = (signal.pair, signal.direction, signal.expiry)
+        now = time.monotonic()
+        if key == self._last_journaled_signal_key and now - self._last_signal_journaled_at < interval:
+            return False
+        self._last_journaled_signal_key = key
+        self._last_signal_journaled_at = now
+        return True
+
+    def execute_last_signal(self, now: datetime | None = None) -> str:
+        if self.session.stats.state is not LifecycleState.RUNNING:
             return "Cannot execute signal: session is not running"
         if self.last_signal is None:
             return "No signal to execute"
@@ -153,11 +242,11 @@ class BotController:
                 direction=self.last_signal.direction,
                 expiry=self.last_signal.expiry,
                 confidence=self.last_signal.confidence,
-                timestamp=datetime.utcnow(),
-                reason=f"execution-attempt | {apply_message}",
+                reason=f"execution-attempt | {apply_message} | {self.last_signal.reason}",
             )
         )
-        result = self.execution_adapter.execute_signal(self.last_signal, self.session.stats.current_stake)
+        self.attempts_version += 1
+        result = self.execution_adapter.execute_signal(self.last_signal, self.session.stats.current_stake, now=now)
         self.last_execution_message = result.message
         if not result.accepted:
             return result.message
@@ -165,24 +254,27 @@ class BotController:
         if result.outcome is None:
             return result.message
 
-        if result.outcome == TradeOutcome.WIN:
+        if result.outcome is TradeOutcome.WIN:
             return f"{result.message} | {self.record_win(pair=result.pair)}"
         return f"{result.message} | {self.record_loss(pair=result.pair)}"
 
     def open_broker_session(self) -> str:
-        if not isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
+        adapter = self._selenium_adapter
+        if adapter is None:
             return "Broker session open is available only in broker_plugin mode"
-        return self.execution_adapter.open_session()
+        return adapter.open_session()
 
     def is_broker_logged_in(self) -> bool:
-        if not isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
+        adapter = self._selenium_adapter
+        if adapter is None:
             return True
-        return self.execution_adapter.is_logged_in()
+        return adapter.is_logged_in()
 
     def run_selector_health_check(self) -> str:
-        if not isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
+        adapter = self._selenium_adapter
+        if adapter is None:
             return "Selector check is available only in broker_plugin mode"
-        checks = self.execution_adapter.selector_health_check()
+        checks = adapter.selector_health_check()
         ok = [name for name, passed in checks.items() if passed]
         bad = [name for name, passed in checks.items() if not passed]
         return (
@@ -204,10 +296,15 @@ class BotController:
         return lines
 
     def device_id(self) -> str:
-        return self.license_validator.current_device_id()
+        if self._device_id is None:
+            self._device_id = self.license_validator.current_device_id()
+        return self._device_id
+
+    def reload_env(self) -> None:
+        self._activation_bot_username = os.getenv("TELEGRAM_ACTIVATION_BOT", "austinpaymentbot").strip().lstrip("@")
 
     def activation_bot_username(self) -> str:
-        return os.getenv("TELEGRAM_ACTIVATION_BOT", "austinpaymentbot").strip().lstrip("@")
+        return self._activation_bot_username
 
     def activation_bot_url(self) -> str | None:
         username = self.activation_bot_username()
@@ -217,15 +314,16 @@ class BotController:
         return f"https://t.me/{username}?start={payload}"
 
     def _activation_start_payload(self) -> str:
-        payload = {
-            "device_id": self.device_id(),
-            "device_model": self.device_model(),
-        }
-        encoded = base64.urlsafe_b64encode(json.dumps(payload, separators=(",", ":")).encode("utf-8")).decode("utf-8")
-        return f"actj_{encoded.rstrip('=')}"
+        if self._activation_payload is None:
+            payload_text = _ACTIVATION_PAYLOAD_TEMPLATE % (json.dumps(self.device_id()), json.dumps(self.device_model()))
+            encoded = base64.urlsafe_b64encode(payload_text.encode("utf-8")).rstrip(b"=")
+            self._activation_payload = "actj_" + encoded.decode("ascii")
+        return self._activation_payload
 
     def device_model(self) -> str:
-        return get_device_model()
+        if self._device_model is None:
+            self._device_model = get_device_model()
+        return self._device_model
 
     def license_activation_message(self, reason: str) -> str:
         parts = [
@@ -244,49 +342,63 @@ class BotController:
         return " | ".join(parts)
 
     def recheck_license(self) -> str:
+        self._device_id = None
+        self._device_model = None
+        self._activation_payload = None
+        self.reload_env()
         return "License check disabled"
 
     def status_text(self) -> str:
         stats = self.session.stats
-        direction = stats.current_direction.value if stats.current_mode == BotMode.SLIDE else "both"
-        target_remaining = round(self.settings.target_profit - stats.session_profit, 2)
+        settings = self.settings
+        direction = stats.current_direction.value if stats.current_mode is BotMode.SLIDE else "both"
+        last_signal = self.last_signal
         last_signal_text = (
-            f"{self.last_signal.pair} {self.last_signal.direction.value.upper()} {self.last_signal.expiry} @ {self.last_signal.confidence}"
-            if self.last_signal
+            f"{last_signal.pair} {last_signal.direction.value.upper()} {last_signal.expiry} @ {last_signal.confidence}"
+            if last_signal
             else "none"
         )
         schedule_text = (
-            f"{self.settings.schedule_start_hour:02d}:00-{self.settings.schedule_end_hour:02d}:00"
-            if self.settings.schedule_enabled
+            f"{settings.schedule_start_hour:02d}:00-{settings.schedule_end_hour:02d}:00"
+            if settings.schedule_enabled
             else "disabled"
         )
-        return (
-            f"State: {stats.state.value}\\n"
-            f"Profit: {stats.session_profit}\\n"
-            f"Target remaining: {target_remaining}\\n"
-            f"Trades: {stats.trades_taken} | Wins: {stats.wins} | Losses: {stats.losses}\\n"
-            f"Current stake: {stats.current_stake}\\n"
-            f"Execution mode: {self.settings.execution_mode.value}\\n"
-            f"Broker dry run: {self.settings.broker_dry_run} ({self.execution_adapter.name})\\n"
-            f"Auto open on start: {self.settings.auto_open_broker_on_start}\\n"
-            f"Auto execute signals: {self.settings.auto_execute_signals}\\n"
-            f"Mode: {stats.current_mode.value} ({direction})\\n"
-            f"Enabled pairs: {', '.join(self.settings.enabled_pairs)}\\n"
-            f"Schedule: {schedule_text}\\n"
-            f"Last signal: {last_signal_text}\\n"
-            f"Last execution: {self.last_execution_message}"
+        return "\n".join(
+            (
+                f"State: {stats.state.value}",
+                f"Profit: {stats.session_profit}",
+                f"Target remaining: {round(settings.target_profit - stats.session_profit, 2)}",
+                f"Trades: {stats.trades_taken} | Wins: {stats.wins} | Losses: {stats.losses}",
+                f"Current stake: {stats.current_stake}",
+                f"Execution mode: {settings.execution_mode.value}",
+                f"Broker dry run: {settings.broker_dry_run} ({self.execution_adapter.name})",
+                f"Auto open on start: {settings.auto_open_broker_on_start}",
+                f"Auto execute signals: {settings.auto_execute_signals}",
+                f"Mode: {stats.current_mode.value} ({direction})",
+                f"Enabled pairs: {', '.join(settings.enabled_pairs)}",
+                f"Schedule: {schedule_text}",
+                f"Last signal: {last_signal_text}",
+                f"Last execution: {self.last_execution_message}",
+            )
         )
 
     def _start_auto_trade_loop(self) -> None:
         if self._auto_trade_running:
+            self._wake.set()
             return
         self._auto_trade_running = True
-        self._auto_trade_thread = threading.Thread(target=self._auto_trade_worker, daemon=True)
+        self._auto_trade_generation += 1
+        self._auto_trade_thread = threading.Thread(
+            target=self._auto_trade_worker,
+            args=(self._auto_trade_generation,),
+            daemon=True,
+        )
         self._auto_trade_thread.start()
 
     def _stop_auto_trade_loop(self) -> None:
         self._auto_trade_running = False
         self._next_trade_at = 0.0
+        self._wake.set()
 
     def _stop_for_target_profit(self, profit: float) -> None:
         self._stop_auto_trade_loop()
@@ -296,12 +408,14 @@ class BotController:
             f"🎉 Congratulations! Take profit reached: {profit} >= {self.settings.target_profit}."
         )
         self.journal.log_session(self.session.stats)
+        self._notify_state_change()
 
     def _check_broker_take_profit(self) -> bool:
-        if not isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
+        adapter = self._selenium_adapter
+        if adapter is None:
             return False
 
-        balance = self.execution_adapter.get_account_balance()
+        balance = adapter.get_account_balance()
         if balance is None:
             return False
 
@@ -313,77 +427,75 @@ class BotController:
         broker_profit = round(balance - self._broker_start_balance, 2)
         self.session.stats.session_profit = broker_profit
 
-        if broker_profit >= self.settings.target_profit:
+        if self.session.stats.session_profit_cents >= round(self.settings.target_profit * 100):
             self._stop_for_target_profit(broker_profit)
             return True
 
         return False
 
-    def _auto_trade_worker(self) -> None:
-        while self._auto_trade_running:
+    def _auto_trade_worker(self, generation: int) -> None:
+        while self._auto_trade_running and generation == self._auto_trade_generation:
+            self._wake.clear()
             try:
-                if self.session.stats.state.value != "running":
-                    time.sleep(0.35)
-                    continue
-
-                if self.settings.execution_mode != ExecutionMode.BROKER_PLUGIN:
-                    time.sleep(0.5)
-                    continue
-
-                if not isinstance(self.execution_adapter, PocketOptionSeleniumAdapter):
-                    time.sleep(0.5)
-                    continue
-
-                if not self.is_broker_logged_in():
-                    self.last_execution_message = "Waiting for Pocket Option login..."
-                    time.sleep(1.0)
-                    continue
-
-                if self._check_broker_take_profit():
-                    continue
-
-                now = time.monotonic()
-                if now < self._next_trade_at:
-                    time.sleep(0.25)
-                    continue
-
-                pair = self.settings.enabled_pairs[0] if self.settings.enabled_pairs else "OTC"
-                direction = self._next_click_direction()
-                signal = TradeSignal(
-                    pair=pair,
-                    direction=direction,
-                    expiry=self.settings.time_period,
-                    confidence=1.0,
-                    timestamp=datetime.utcnow(),
-                    reason="direct-click-loop",
-                )
-                self.last_signal = signal
-                self.journal.log_signal(signal)
-                result_message = self.execute_last_signal()
-                self.last_execution_message = result_message
-
-                normalized = (result_message or "").lower()
-                if (
-                    "execution failed" in normalized
-                    or "unable to set" in normalized
-                    or "not applied" in normalized
-                    or "cannot execute" in normalized
-                    or "selenium" in normalized and "not installed" in normalized
-                ):
-                    self._next_trade_at = time.monotonic() + 5.0
-                else:
-                    self._next_trade_at = time.monotonic() + self._trade_cooldown_seconds
+                timeout = self._auto_trade_step()
             except Exception as exc:
                 self.last_execution_message = f"Auto loop error: {exc}"
-            finally:
-                time.sleep(0.2)
+                timeout = 1.0
+            self._wake.wait(timeout)
+
+    def _auto_trade_step(self) -> float | None:
+        if (
+            self.session.stats.state is not LifecycleState.RUNNING
+            or self.settings.execution_mode != ExecutionMode.BROKER_PLUGIN
+            or self._selenium_adapter is None
+        ):
+            return None
+
+        if not self.is_broker_logged_in():
+            self.last_execution_message = "Waiting for Pocket Option login..."
+            return 1.0
+
+        if self._check_broker_take_profit():
+            return None
+
+        remaining = self._next_trade_at - time.monotonic()
+        if remaining > 0:
+            return min(remaining, self._take_profit_poll_seconds)
+
+        direction = self._pick_direction()
+        signal = TradeSignal(
+            pair=self._primary_pair,
+            direction=direction,
+            expiry=self.settings.time_period,
+            confidence=1.0,
+            reason="direct-click-loop",
+        )
+        self.last_signal = signal
+        result_message = self.execute_last_signal()
+        self.last_execution_message = result_message
+
+        normalized = (result_message or "").lower()
+        if (
+            "execution failed" in normalized
+            or "unable to set" in normalized
+            or "not applied" in normalized
+            or "cannot execute" in normalized
+            or "selenium" in normalized and "not installed" in normalized
+        ):
+            self._next_trade_at = time.monotonic() + 5.0
+        else:
+            self._next_trade_at = time.monotonic() + self._trade_cooldown_seconds
+        return min(self._next_trade_at - time.monotonic(), self._take_profit_poll_seconds)
+
+    def _refresh_direction_picker(self) -> None:
+        self._pick_direction = self._slide_pick if self.settings.mode is BotMode.SLIDE else self._oscillate_pick
 
-    def _next_click_direction(self) -> SlideDirection:
-        if self.settings.mode == BotMode.SLIDE:
-            return self.settings.slide_direction
+    def _slide_pick(self) -> SlideDirection:
+        return self.settings.slide_direction
 
+    def _oscillate_pick(self) -> SlideDirection:
         direction = self._oscillate_next_direction
         self._oscillate_next_direction = (
-            SlideDirection.SELL if direction == SlideDirection.BUY else SlideDirection.BUY
+            SlideDirection.SELL if direction is SlideDirection.BUY else SlideDirection.BUY
         )
         return direction
@@ -1,8 +1,23 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 from enum import Enum
+import time
+
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def utc_from_ns(timestamp_ns: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=timestamp_ns // 1000)
+
+
+def ns_from_utc(value: datetime) -> int:
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return ((value - _EPOCH) // _MICROSECOND) * 1000
 
 
 class BotMode(str, Enum):
@@ -39,6 +54,11 @@ class ExecutionMode(str, Enum):
     BROKER_PLUGIN = "broker_plugin"
 
 
+_VALID_EXPIRIES = frozenset({"S5", "S10", "S15", "S30", "M1", "M2", "M5"})
+_VALID_EXECUTION_MODES = frozenset(ExecutionMode)
+_REQUIRED_SELECTORS = frozenset({"amount_input", "buy_button", "sell_button"})
+
+
 @dataclass(slots=True)
 class BotSettings:
     trade_capital: float = 100.0
@@ -68,6 +88,8 @@ class BotSettings:
     broker_dry_run: bool = False
     auto_open_broker_on_start: bool = True
     auto_execute_signals: bool = True
+    keep_browser_open: bool = False
+    min_signal_log_interval_s: float = 0.0
     pocket_option_url: str = "https://pocketoption.com/en/cabinet/demo-quick-high-low/"
     broker_selectors: dict[str, str] = field(
         default_factory=lambda: {
@@ -98,32 +120,32 @@ class BotSettings:
             raise ValueError("Martingale % must be between 0 and 500")
         if self.martingale_limit < 0 or self.martingale_limit > 20:
             raise ValueError("Martingale Limit must be between 0 and 20")
-        if self.time_period not in {"S5", "S10", "S15", "S30", "M1", "M2", "M5"}:
+        if self.time_period not in _VALID_EXPIRIES:
             raise ValueError("Time Period must be one of S5,S10,S15,S30,M1,M2,M5")
         if self.payout_rate <= 0 or self.payout_rate > 1.0:
             raise ValueError("Payout rate must be between 0 and 1")
         if not self.enabled_pairs:
             raise ValueError("At least one OTC pair must be enabled")
-        valid_expiries = {"S5", "S10", "S15", "S30", "M1", "M2", "M5"}
         for pair in self.enabled_pairs:
             if pair not in self.pair_expiry_rules:
                 raise ValueError(f"Enabled pair '{pair}' is not in pair expiry rules")
         for pair, expiry_list in self.pair_expiry_rules.items():
             if not expiry_list:
                 raise ValueError(f"Pair '{pair}' must define at least one allowed expiry")
-            for expiry in expiry_list:
-                if expiry not in valid_expiries:
-                    raise ValueError(f"Pair '{pair}' has invalid expiry '{expiry}'")
+            if not _VALID_EXPIRIES.issuperset(expiry_list):
+                invalid = next(expiry for expiry in expiry_list if expiry not in _VALID_EXPIRIES)
+                raise ValueError(f"Pair '{pair}' has invalid expiry '{invalid}'")
         if self.schedule_start_hour < 0 or self.schedule_start_hour > 23:
             raise ValueError("Schedule start hour must be between 0 and 23")
         if self.schedule_end_hour < 0 or self.schedule_end_hour > 23:
             raise ValueError("Schedule end hour must be between 0 and 23")
-        if self.execution_mode not in {ExecutionMode.MANUAL, ExecutionMode.SIMULATED, ExecutionMode.BROKER_PLUGIN}:
+        if self.execution_mode not in _VALID_EXECUTION_MODES:
             raise ValueError("Execution mode must be manual, simulated, or broker_plugin")
+        if self.min_signal_log_interval_s < 0:
+            raise ValueError("Minimum signal log interval must be >= 0")
         if not self.pocket_option_url.startswith("http"):
             raise ValueError("Pocket Option URL must start with http/https")
-        required_selectors = {"amount_input", "buy_button", "sell_button"}
-        if not required_selectors.issubset(set(self.broker_selectors.keys())):
+        if not _REQUIRED_SELECTORS <= self.broker_selectors.keys():
             raise ValueError("Broker selectors must include amount_input, buy_button, sell_button")
 
 
@@ -131,7 +153,7 @@ class BotSettings:
 class SessionStats:
     state: LifecycleState = LifecycleState.STOPPED
     start_balance: float = 0.0
-    session_profit: float = 0.0
+    session_profit_cents: int = 0
     trades_taken: int = 0
     wins: int = 0
     losses: int = 0
@@ -144,6 +166,14 @@ class SessionStats:
     stopped_at: datetime | None = None
     stop_reason: StopReason | None = None
 
+    @property
+    def session_profit(self) -> float:
+        return self.session_profit_cents / 100
+
+    @session_profit.setter
+    def session_profit(self, value: float) -> None:
+        self.session_profit_cents = round(value * 100)
+
 
 @dataclass(slots=True)
 class TradeSignal:
@@ -151,8 +181,12 @@ class TradeSignal:
     direction: SlideDirection
     expiry: str
     confidence: float
-    timestamp: datetime
     reason: str
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return utc_from_ns(self.timestamp_ns)
 
 
 @dataclass(slots=True)
@@ -163,4 +197,8 @@ class TradeRecord:
     expiry: str
     outcome: TradeOutcome
     pnl: float
-    timestamp: datetime = field(default_factory=datetime.utcnow)
+    timestamp_ns: int = field(default_factory=time.time_ns)
+
+    @property
+    def timestamp(self) -> datetime:
+        return utc_from_ns(self.timestamp_ns)
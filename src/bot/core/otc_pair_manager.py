@@ -5,9 +5,19 @@ from datetime import datetime
 from .models import BotSettings
 
 
+_NS_PER_HOUR = 3_600_000_000_000
+
+
 class OTCPairManager:
     def __init__(self, settings: BotSettings) -> None:
+        self.apply_settings(settings)
+
+    def apply_settings(self, settings: BotSettings) -> None:
         self.settings = settings
+        self._expiry_index: dict[str, frozenset[str]] = {
+            pair: frozenset(expiry.upper() for expiry in expiries)
+            for pair, expiries in settings.pair_expiry_rules.items()
+        }
 
     def available_pairs(self) -> list[str]:
         return sorted(self.settings.pair_expiry_rules.keys())
@@ -19,14 +29,20 @@ class OTCPairManager:
         return pair in self.settings.enabled_pairs
 
     def is_expiry_allowed(self, pair: str, expiry: str) -> bool:
-        allowed = self.settings.pair_expiry_rules.get(pair, [])
-        return expiry.upper() in allowed
+        allowed = self._expiry_index.get(pair)
+        return allowed is not None and expiry.upper() in allowed
 
     def is_within_schedule(self, when: datetime) -> bool:
         if not self.settings.schedule_enabled:
             return True
+        return self._is_hour_in_schedule(when.hour)
+
+    def is_within_schedule_ns(self, when_ns: int) -> bool:
+        if not self.settings.schedule_enabled:
+            return True
+        return self._is_hour_in_schedule(when_ns // _NS_PER_HOUR % 24)
 
-        hour = when.hour
+    def _is_hour_in_schedule(self, hour: int) -> bool:
         start = self.settings.schedule_start_hour
         end = self.settings.schedule_end_hour
 
@@ -39,4 +55,11 @@ class OTCPairManager:
             return False
         if not self.is_expiry_allowed(pair, expiry):
             return False
-        return self.is_within_schedule(when)
\ No newline at end of file
+        return self.is_within_schedule(when)
+
+    def can_trade_ns(self, pair: str, expiry: str, when_ns: int) -> bool:
+        if not self.is_pair_enabled(pair):
+            return False
+        if not self.is_expiry_allowed(pair, expiry):
+            return False
+        return self.is_within_schedule_ns(when_ns)
\ No newline at end of file
@@ -5,7 +5,11 @@ from .models import BotSettings, StopReason
 
 class RiskEngine:
     def __init__(self, settings: BotSettings) -> None:
+        self.apply_settings(settings)
+
+    def apply_settings(self, settings: BotSettings) -> None:
         self.settings = settings
+        self._martingale_multiplier = 1.0 + settings.martingale_percent / 100.0
 
     def next_stake(self, base_stake: float, last_stake: float, last_was_loss: bool) -> float:
         if self.settings.disable_martingale:
@@ -14,7 +18,7 @@ class RiskEngine:
         if not last_was_loss:
             return base_stake
 
-        return round(last_stake * (1 + self.settings.martingale_percent / 100), 2)
+        return round(last_stake * self._martingale_multiplier, 2)
 
     def martingale_stop_triggered(self, current_step: int) -> bool:
         if self.settings.disable_martingale:
@@ -15,12 +15,24 @@ from .risk_engine import RiskEngine
 
 class SessionEngine:
     def __init__(self, settings: BotSettings) -> None:
-        self.settings = settings
         self.risk = RiskEngine(settings)
         self.stats = SessionStats()
+        self._apply_derived(settings)
+
+    def apply_settings(self, settings: BotSettings) -> None:
+        self.risk.apply_settings(settings)
+        self._apply_derived(settings)
+        # Stats outlive a settings save, so a running session follows the new mode and side.
+        self.stats.current_mode = settings.mode
+        self.stats.current_direction = settings.slide_direction
+
+    def _apply_derived(self, settings: BotSettings) -> None:
+        self.settings = settings
+        self._win_cents_multiplier = settings.payout_rate * 100
+        self._target_profit_cents = round(settings.target_profit * 100)
 
     def start(self) -> None:
-        if self.stats.state == LifecycleState.RUNNING:
+        if self.stats.state is LifecycleState.RUNNING:
             return
         self.stats = SessionStats(
             state=LifecycleState.RUNNING,
@@ -32,11 +44,11 @@ class SessionEngine:
         )
 
     def pause(self) -> None:
-        if self.stats.state == LifecycleState.RUNNING:
+        if self.stats.state is LifecycleState.RUNNING:
             self.stats.state = LifecycleState.PAUSED
 
     def resume(self) -> None:
-        if self.stats.state == LifecycleState.PAUSED:
+        if self.stats.state is LifecycleState.PAUSED:
             self.stats.state = LifecycleState.RUNNING
 
     def stop(self, reason: StopReason = StopReason.USER_STOP) -> None:
@@ -45,15 +57,18 @@ class SessionEngine:
         self.stats.stopped_at = datetime.utcnow()
 
     def apply_trade_outcome(self, outcome: TradeOutcome, pair: str = "OTC") -> TradeRecord:
-        if self.stats.state != LifecycleState.RUNNING:
+        if self.stats.state is not LifecycleState.RUNNING:
             raise RuntimeError("Session is not running")
 
         stake = self.stats.current_stake
-        pnl = round(stake * self.settings.payout_rate, 2) if outcome == TradeOutcome.WIN else -stake
+        if outcome is TradeOutcome.WIN:
+            pnl_cents = round(stake * self._win_cents_multiplier)
+        else:
+            pnl_cents = -round(stake * 100)
         self.stats.trades_taken += 1
-        self.stats.session_profit = round(self.stats.session_profit + pnl, 2)
+        self.stats.session_profit_cents += pnl_cents
 
-        if outcome == TradeOutcome.WIN:
+        if outcome is TradeOutcome.WIN:
             self.stats.wins += 1
             self.stats.loss_streak = 0
             self.stats.martingale_step = 0
@@ -68,29 +83,29 @@ class SessionEngine:
             stake=stake,
             expiry=self.settings.time_period,
             outcome=outcome,
-            pnl=pnl,
+            pnl=pnl_cents / 100,
         )
 
         self._enforce_stop_rules(outcome)
         return record
 
     def _enforce_stop_rules(self, outcome: TradeOutcome) -> None:
-        if self.stats.session_profit >= self.settings.target_profit:
+        if self.stats.session_profit_cents >= self._target_profit_cents:
             self.stop(StopReason.TARGET_PROFIT_REACHED)
             return
 
-        if outcome == TradeOutcome.LOSS and self.risk.martingale_stop_triggered(self.stats.martingale_step):
+        if outcome is TradeOutcome.LOSS and self.risk.martingale_stop_triggered(self.stats.martingale_step):
             self.stop(StopReason.MARTINGALE_LIMIT_REACHED)
             return
 
-        if self.stats.state != LifecycleState.RUNNING:
+        if self.stats.state is not LifecycleState.RUNNING:
             return
 
         remaining = self.settings.trade_capital + self.stats.session_profit
         next_stake = self.risk.next_stake(
             base_stake=self.settings.trade_amount,
             last_stake=self.stats.current_stake,
-            last_was_loss=(outcome == TradeOutcome.LOSS),
+            last_was_loss=(outcome is TradeOutcome.LOSS),
         )
 
         if self.risk.exceeds_capital_guardrail(next_stake, remaining):
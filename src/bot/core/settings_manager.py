@@ -1,17 +1,123 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
 from dataclasses import asdict
 from pathlib import Path
 
 from .models import BotMode, BotSettings, ExecutionMode, SlideDirection
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+def _dump_json(data: dict, indent: bool = False) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    return json.dumps(data, indent=2 if indent else None).encode("utf-8")
+
+
+def _str_list(items: list) -> list[str]:
+    if type(items) is list and all(type(item) is str for item in items):
+        return items
+    return [str(item) for item in items]
+
+
+def _str_map(data: dict) -> dict[str, str]:
+    if all(type(key) is str and type(value) is str for key, value in data.items()):
+        return data
+    return {str(key): str(value) for key, value in data.items()}
+
+
+def _expiry_rules(data: dict) -> dict[str, list[str]]:
+    if all(
+        type(pair) is str and type(expiries) is list and all(type(expiry) is str and expiry.isupper() for expiry in expiries)
+        for pair, expiries in data.items()
+    ):
+        return data
+    return {str(pair): [str(expiry).upper() for expiry in expiries] for pair, expiries in data.items()}
+
+
+# Profiles written before these fields existed keep the values the loader
+# has always filled in for them, which differ from the BotSettings defaults.
+_MISSING_KEY_DEFAULTS = {
+    "execution_mode": "manual",
+    "broker_dry_run": True,
+    "broker_selectors": {
+        "amount_input": "input[type='text'][inputmode='decimal']",
+        "buy_button": "button[data-test='button-buy'], .btn-call",
+        "sell_button": "button[data-test='button-sell'], .btn-put",
+        "pair_dropdown": ".current-symbol",
+        "pair_search": "input[type='search']",
+        "pair_item": "[data-symbol='{pair}']",
+        "expiry_dropdown": ".expiration-select",
+        "expiry_item": "[data-expiration='{expiry}']",
+    },
+}
+_FIELD_CONVERTERS = {
+    "trade_capital": float,
+    "target_profit": float,
+    "trade_amount": float,
+    "stack_method": str,
+    "time_period": str,
+    "martingale_percent": float,
+    "martingale_limit": int,
+    "disable_martingale": bool,
+    "mode": BotMode,
+    "slide_direction": SlideDirection,
+    "payout_rate": float,
+    "enabled_pairs": _str_list,
+    "pair_expiry_rules": _expiry_rules,
+    "schedule_enabled": bool,
+    "schedule_start_hour": int,
+    "schedule_end_hour": int,
+    "execution_mode": ExecutionMode,
+    "broker_dry_run": bool,
+    "auto_open_broker_on_start": bool,
+    "auto_execute_signals": bool,
+    "keep_browser_open": bool,
+    "min_signal_log_interval_s": float,
+    "pocket_option_url": str,
+    "broker_selectors": _str_map,
+}
+
+
+def _settings_from_dict(data: dict) -> BotSettings:
+    kwargs = {}
+    for name, convert in _FIELD_CONVERTERS.items():
+        if name in data:
+            kwargs[name] = convert(data[name])
+        elif name in _MISSING_KEY_DEFAULTS:
+            kwargs[name] = convert(copy.copy(_MISSING_KEY_DEFAULTS[name]))
+    return BotSettings(**kwargs)
+
+
+def _write_atomic(path: Path, payload: bytes) -> None:
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, "wb", buffering=64 * 1024) as handle:
+        handle.write(payload)
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+
+
+def _load_json(path: Path) -> dict:
+    raw = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class SettingsManager:
     def __init__(self, profiles_dir: Path) -> None:
         self.profiles_dir = profiles_dir
         self.profiles_dir.mkdir(parents=True, exist_ok=True)
         self.last_used_path = self.profiles_dir / "last_used.json"
+        self._cache: dict[Path, tuple[int, BotSettings]] = {}
+        self._last_used_cache: tuple[int, str] | None = None
 
     def save_profile(self, settings: BotSettings, profile_name: str = "default") -> Path:
         settings.validate()
@@ -20,77 +126,51 @@ class SettingsManager:
         data["mode"] = settings.mode.value
         data["slide_direction"] = settings.slide_direction.value
         data["execution_mode"] = settings.execution_mode.value
-        profile_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-        self.last_used_path.write_text(json.dumps({"profile": profile_name}), encoding="utf-8")
+        _write_atomic(profile_path, _dump_json(data, indent=True))
+        self._cache.pop(profile_path, None)
+        self._record_last_used(profile_name)
         return profile_path
 
+    def _record_last_used(self, profile_name: str) -> None:
+        cached = self._last_used_cache
+        if cached is not None and cached[1] == profile_name:
+            try:
+                if self.last_used_path.stat().st_mtime_ns == cached[0]:
+                    return
+            except FileNotFoundError:
+                pass
+        _write_atomic(self.last_used_path, _dump_json({"profile": profile_name}))
+        self._last_used_cache = (self.last_used_path.stat().st_mtime_ns, profile_name)
+
     def load_profile(self, profile_name: str = "default") -> BotSettings:
         profile_path = self.profiles_dir / f"{profile_name}.json"
-        if not profile_path.exists():
+        try:
+            mtime_ns = profile_path.stat().st_mtime_ns
+        except FileNotFoundError:
             settings = BotSettings()
             self.save_profile(settings, profile_name=profile_name)
             return settings
 
-        data = json.loads(profile_path.read_text(encoding="utf-8"))
-        settings = BotSettings(
-            trade_capital=float(data.get("trade_capital", 100.0)),
-            target_profit=float(data.get("target_profit", 20.0)),
-            trade_amount=float(data.get("trade_amount", 1.0)),
-            stack_method=str(data.get("stack_method", "martingale")),
-            time_period=str(data.get("time_period", "S5")),
-            martingale_percent=float(data.get("martingale_percent", 80.0)),
-            martingale_limit=int(data.get("martingale_limit", 5)),
-            disable_martingale=bool(data.get("disable_martingale", False)),
-            mode=BotMode(data.get("mode", "oscillate")),
-            slide_direction=SlideDirection(data.get("slide_direction", "buy")),
-            payout_rate=float(data.get("payout_rate", 0.82)),
-            enabled_pairs=[str(item) for item in data.get("enabled_pairs", ["EURUSD_otc", "GBPUSD_otc"])],
-            pair_expiry_rules={
-                str(pair): [str(expiry).upper() for expiry in expiries]
-                for pair, expiries in data.get(
-                    "pair_expiry_rules",
-                    {
-                        "EURUSD_otc": ["S5", "S10", "S15", "S30", "M1", "M2", "M5"],
-                        "GBPUSD_otc": ["S5", "S10", "S15", "S30", "M1", "M2"],
-                        "USDJPY_otc": ["S5", "S10", "S15", "S30", "M1"],
-                        "AUDUSD_otc": ["S5", "S10", "S15", "M1"],
-                    },
-                ).items()
-            },
-            schedule_enabled=bool(data.get("schedule_enabled", False)),
-            schedule_start_hour=int(data.get("schedule_start_hour", 0)),
-            schedule_end_hour=int(data.get("schedule_end_hour", 23)),
-            execution_mode=ExecutionMode(data.get("execution_mode", "manual")),
-            broker_dry_run=bool(data.get("broker_dry_run", True)),
-            auto_open_broker_on_start=bool(data.get("auto_open_broker_on_start", True)),
-            auto_execute_signals=bool(data.get("auto_execute_signals", True)),
-            pocket_option_url=str(
-                data.get("pocket_option_url", "https://pocketoption.com/en/cabinet/demo-quick-high-low/")
-            ),
-            broker_selectors={
-                str(k): str(v)
-                for k, v in data.get(
-                    "broker_selectors",
-                    {
-                        "amount_input": "input[type='text'][inputmode='decimal']",
-                        "buy_button": "button[data-test='button-buy'], .btn-call",
-                        "sell_button": "button[data-test='button-sell'], .btn-put",
-                        "pair_dropdown": ".current-symbol",
-                        "pair_search": "input[type='search']",
-                        "pair_item": "[data-symbol='{pair}']",
-                        "expiry_dropdown": ".expiration-select",
-                        "expiry_item": "[data-expiration='{expiry}']",
-                    },
-                ).items()
-            },
-        )
+        cached = self._cache.get(profile_path)
+        if cached is not None and cached[0] == mtime_ns:
+            return copy.deepcopy(cached[1])
+
+        data = _load_json(profile_path)
+        settings = _settings_from_dict(data)
         settings.validate()
+        self._cache[profile_path] = (mtime_ns, copy.deepcopy(settings))
         return settings
 
     def load_last_used(self) -> BotSettings:
-        if not self.last_used_path.exists():
+        try:
+            mtime_ns = self.last_used_path.stat().st_mtime_ns
+        except FileNotFoundError:
             return self.load_profile("default")
 
-        payload = json.loads(self.last_used_path.read_text(encoding="utf-8"))
+        if self._last_used_cache is not None and self._last_used_cache[0] == mtime_ns:
+            return self.load_profile(self._last_used_cache[1])
+
+        payload = _load_json(self.last_used_path)
         profile = str(payload.get("profile", "default"))
+        self._last_used_cache = (mtime_ns, profile)
         return self.load_profile(profile)
@@ -1,96 +1,154 @@
 from __future__ import annotations
 
-from collections import deque
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
+import time
 
-from .models import BotMode, BotSettings, SlideDirection, TradeSignal
+from .models import BotMode, BotSettings, SlideDirection, TradeSignal, ns_from_utc
 from .otc_pair_manager import OTCPairManager
 
 
+_PRICE_HISTORY = 200
+_NS_PER_SECOND = 1_000_000_000
+_EXPIRY_SECONDS = {
+    "S5": 5,
+    "S10": 10,
+    "S15": 15,
+    "S30": 30,
+    "M1": 60,
+    "M2": 120,
+    "M5": 300,
+}
+
+
 @dataclass(slots=True)
 class PairState:
-    prices: deque[float] = field(default_factory=lambda: deque(maxlen=200))
-    cooldown_until: datetime | None = None
-    active_trade_until: datetime | None = None
+    prices: list[float] = field(default_factory=lambda: [0.0] * _PRICE_HISTORY)
+    head: int = 0
+    count: int = 0
+    ready_at_ns: int = 0
+    last_price: float | None = None
+    warmup: int = 0
+    avg_gain: float = 0.0
+    avg_loss: float = 0.0
+    short_sum: float = 0.0
+    long_sum: float = 0.0
 
 
 class StrategyEngine:
     def __init__(self, settings: BotSettings, pair_manager: OTCPairManager) -> None:
-        self.settings = settings
         self.pair_manager = pair_manager
         self.states: dict[str, PairState] = {}
         self.rsi_period = 14
         self.short_ma_period = 5
         self.long_ma_period = 20
+        self._rsi_alpha = 1.0 / self.rsi_period
+        # RSI is warm after rsi_period deltas, i.e. rsi_period + 1 samples.
+        self._min_samples = max(self.long_ma_period, self.rsi_period) + 1
+        self._refresh_settings(settings)
+
+    def apply_settings(self, settings: BotSettings) -> None:
+        self._refresh_settings(settings)
+        self.states = {pair: state for pair, state in self.states.items() if pair in settings.enabled_pairs}
+
+    def _refresh_settings(self, settings: BotSettings) -> None:
+        self.settings = settings
+        self._required_direction = settings.slide_direction if settings.mode is BotMode.SLIDE else None
+        # The post-signal cooldown always outlasts the trade lock, so one deadline covers both.
+        self._ready_delay_ns = max(self._expiry_to_seconds(settings.time_period), 5) * _NS_PER_SECOND
 
     def on_price(self, pair: str, price: float, timestamp: datetime | None = None) -> TradeSignal | None:
-        now = timestamp or datetime.utcnow()
-        if not self.pair_manager.can_trade(pair=pair, expiry=self.settings.time_period, when=now):
+        now_ns = ns_from_utc(timestamp) if timestamp is not None else time.time_ns()
+        if not self.pair_manager.can_trade_ns(pair=pair, expiry=self.settings.time_period, when_ns=now_ns):
             return None
 
         state = self.states.setdefault(pair, PairState())
-        state.prices.append(price)
+        self._update_indicators(state, price)
 
-        if state.active_trade_until and now < state.active_trade_until:
+        if now_ns < state.ready_at_ns or state.count < self._min_samples:
             return None
 
-        if state.cooldown_until and now < state.cooldown_until:
-            return None
-
-        if len(state.prices) < self.long_ma_period + 1:
+        short_ma = state.short_sum / self.short_ma_period
+        long_ma = state.long_sum / self.long_ma_period
+        if short_ma > long_ma:
+            signal_direction = SlideDirection.BUY
+        elif short_ma < long_ma:
+            signal_direction = SlideDirection.SELL
+        else:
             return None
 
-        prices = list(state.prices)
-        rsi = self._compute_rsi(prices, self.rsi_period)
-        if rsi is None:
+        # The MA trend fixes the only direction this tick could signal, so the
+        # slide-mode filter can run before RSI is evaluated.
+        required_direction = self._required_direction
+        if required_direction is not None and signal_direction is not required_direction:
             return None
 
-        short_ma = sum(prices[-self.short_ma_period:]) / self.short_ma_period
-        long_ma = sum(prices[-self.long_ma_period:]) / self.long_ma_period
-        separation = abs(short_ma - long_ma) / max(long_ma, 0.0000001)
-
-        signal_direction: SlideDirection | None = None
-        reason = ""
-        if rsi <= 30 and short_ma > long_ma:
-            signal_direction = SlideDirection.BUY
+        rsi = self._rsi_from_averages(state.avg_gain, state.avg_loss)
+        if signal_direction is SlideDirection.BUY:
+            if rsi > 30:
+                return None
             reason = f"RSI oversold ({rsi:.1f}) + uptrend"
-        elif rsi >= 70 and short_ma < long_ma:
-            signal_direction = SlideDirection.SELL
+        else:
+            if rsi < 70:
+                return None
             reason = f"RSI overbought ({rsi:.1f}) + downtrend"
 
-        if signal_direction is None:
-            return None
-
-        if self.settings.mode == BotMode.SLIDE and signal_direction != self.settings.slide_direction:
-            return None
-
+        separation = abs(short_ma - long_ma) / max(long_ma, 0.0000001)
         confidence = self._confidence(rsi=rsi, separation=separation)
         signal = TradeSignal(
             pair=pair,
             direction=signal_direction,
             expiry=self.settings.time_period,
             confidence=confidence,
-            timestamp=now,
             reason=reason,
+            timestamp_ns=now_ns,
         )
 
-        lock_seconds = self._expiry_to_seconds(self.settings.time_period)
-        state.active_trade_until = now + timedelta(seconds=lock_seconds)
-        state.cooldown_until = now + timedelta(seconds=max(lock_seconds, 5))
+        state.ready_at_ns = now_ns + self._ready_delay_ns
         return signal
 
-    @staticmethod
-    def _compute_rsi(prices: list[float], period: int) -> float | None:
-        if len(prices) < period + 1:
-            return None
-
-        deltas = [prices[i] - prices[i - 1] for i in range(len(prices) - period, len(prices))]
-        gains = [delta for delta in deltas if delta > 0]
-        losses = [-delta for delta in deltas if delta < 0]
-        avg_gain = sum(gains) / period if gains else 0.0
-        avg_loss = sum(losses) / period if losses else 0.0
+    def _update_indicators(self, state: PairState, price: float) -> None:
+        prices = state.prices
+        head = state.head
+        # head is the next write slot; negative offsets wrap to the end of the ring.
+        if state.count >= self.short_ma_period:
+            state.short_sum -= prices[head - self.short_ma_period]
+        if state.count >= self.long_ma_period:
+            state.long_sum -= prices[head - self.long_ma_period]
+        prices[head] = price
+        state.head = (head + 1) % _PRICE_HISTORY
+        if state.count < _PRICE_HISTORY:
+            state.count += 1
+        if state.head == 0:
+            # Once per lap the windows sit contiguously at the end of the ring;
+            # re-sum them exactly so the running totals cannot drift.
+            state.short_sum = sum(prices[-self.short_ma_period:])
+            state.long_sum = sum(prices[-self.long_ma_period:])
+        else:
+            state.short_sum += price
+            state.long_sum += price
+
+        last_price = state.last_price
+        state.last_price = price
+        if last_price is None:
+            return
+
+        delta = price - last_price
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        alpha = self._rsi_alpha
+        if state.warmup < self.rsi_period:
+            # Seed Wilder's averages with the simple mean of the first `period` deltas.
+            state.avg_gain += gain * alpha
+            state.avg_loss += loss * alpha
+            state.warmup += 1
+        else:
+            # avg + (x - avg) / period == (avg * (period - 1) + x) / period
+            state.avg_gain += (gain - state.avg_gain) * alpha
+            state.avg_loss += (loss - state.avg_loss) * alpha
 
+    @staticmethod
+    def _rsi_from_averages(avg_gain: float, avg_loss: float) -> float:
         if avg_loss == 0:
             return 100.0
 
@@ -99,19 +157,9 @@ class StrategyEngine:
 
     @staticmethod
     def _confidence(rsi: float, separation: float) -> float:
-        rsi_extreme = max(abs(rsi - 50) / 50, 0)
-        trend_strength = min(separation * 100, 1.0)
-        return round(min((0.6 * rsi_extreme) + (0.4 * trend_strength), 0.99), 2)
+        # 0.6 * |rsi - 50| / 50 weights RSI extremity; 0.4 weights trend strength.
+        return round(min(0.012 * abs(rsi - 50) + 0.4 * min(separation * 100, 1.0), 0.99), 2)
 
     @staticmethod
     def _expiry_to_seconds(expiry: str) -> int:
-        mapping = {
-            "S5": 5,
-            "S10": 10,
-            "S15": 15,
-            "S30": 30,
-            "M1": 60,
-            "M2": 120,
-            "M5": 300,
-        }
-        return mapping.get(expiry.upper(), 5)
\ No newline at end of file
+        return _EXPIRY_SECONDS.get(expiry.upper(), 5)
\ No newline at end of file
@@ -3,12 +3,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime
 import random
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from bot.core.models import SlideDirection, TradeOutcome, TradeSignal
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ExecutionResult:
     accepted: bool
     message: str
@@ -19,23 +19,19 @@ class ExecutionResult:
     executed_at: datetime | None = None
 
 
-class BrokerAdapter(ABC):
+class BrokerAdapter(Protocol):
     @property
-    @abstractmethod
-    def name(self) -> str:
-        raise NotImplementedError
+    def name(self) -> str: ...
 
-    @abstractmethod
-    def execute_signal(self, signal: TradeSignal, stake: float) -> ExecutionResult:
-        raise NotImplementedError
+    def execute_signal(self, signal: TradeSignal, stake: float, *, now: datetime | None = None) -> ExecutionResult: ...
 
 
-class ManualConfirmAdapter(BrokerAdapter):
+class ManualConfirmAdapter:
     @property
     def name(self) -> str:
         return "manual"
 
-    def execute_signal(self, signal: TradeSignal, stake: float) -> ExecutionResult:
+    def execute_signal(self, signal: TradeSignal, stake: float, *, now: datetime | None = None) -> ExecutionResult:
         return ExecutionResult(
             accepted=True,
             message=(
@@ -45,11 +41,11 @@ class ManualConfirmAdapter(BrokerAdapter):
             pair=signal.pair,
             direction=signal.direction,
             expiry=signal.expiry,
-            executed_at=datetime.utcnow(),
+            executed_at=now,
         )
 
 
-class SimulatedAdapter(BrokerAdapter):
+class SimulatedAdapter:
     def __init__(self, seed: int = 42) -> None:
         self._rng = random.Random(seed)
 
@@ -57,7 +53,7 @@ class SimulatedAdapter(BrokerAdapter):
     def name(self) -> str:
         return "simulated"
 
-    def execute_signal(self, signal: TradeSignal, stake: float) -> ExecutionResult:
+    def execute_signal(self, signal: TradeSignal, stake: float, *, now: datetime | None = None) -> ExecutionResult:
         win_probability = max(min(signal.confidence, 0.95), 0.05)
         roll = self._rng.random()
         outcome = TradeOutcome.WIN if roll <= win_probability else TradeOutcome.LOSS
@@ -71,21 +67,21 @@ class SimulatedAdapter(BrokerAdapter):
             pair=signal.pair,
             direction=signal.direction,
             expiry=signal.expiry,
-            executed_at=datetime.utcnow(),
+            executed_at=now,
         )
 
 
-class BrokerPluginAdapter(BrokerAdapter):
+class BrokerPluginAdapter:
     @property
     def name(self) -> str:
         return "broker_plugin"
 
-    def execute_signal(self, signal: TradeSignal, stake: float) -> ExecutionResult:
+    def execute_signal(self, signal: TradeSignal, stake: float, *, now: datetime | None = None) -> ExecutionResult:
         return ExecutionResult(
             accepted=False,
             message="Broker plugin mode selected but no concrete broker adapter is configured yet.",
             pair=signal.pair,
             direction=signal.direction,
             expiry=signal.expiry,
-            executed_at=datetime.utcnow(),
+            executed_at=now,
         )
@@ -5,7 +5,27 @@ from bot.execution.adapters import BrokerAdapter, ManualConfirmAdapter, Simulate
 from bot.execution.pocket_option_selenium import PocketOptionSeleniumAdapter
 
 
-def build_adapter(settings: BotSettings) -> BrokerAdapter:
+def build_adapter(settings: BotSettings, cache: dict[ExecutionMode, BrokerAdapter] | None = None) -> BrokerAdapter:
+    if cache is None:
+        return _create_adapter(settings)
+    adapter = cache.get(settings.execution_mode)
+    if adapter is None:
+        adapter = _create_adapter(settings)
+        cache[settings.execution_mode] = adapter
+    elif isinstance(adapter, PocketOptionSeleniumAdapter):
+        adapter.settings = settings
+    return adapter
+
+
+def release_adapters(cache: dict[ExecutionMode, BrokerAdapter]) -> None:
+    adapters = list(cache.values())
+    cache.clear()
+    for adapter in adapters:
+        if isinstance(adapter, PocketOptionSeleniumAdapter):
+            adapter.close()
+
+
+def _create_adapter(settings: BotSettings) -> BrokerAdapter:
     if settings.execution_mode == ExecutionMode.MANUAL:
         return ManualConfirmAdapter()
     if settings.execution_mode == ExecutionMode.SIMULATED:
@@ -1,45 +1,582 @@
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
+import json
 import os
 from pathlib import Path
 import re
+import socket
 import subprocess
+import threading
 import time
 
 from bot.core.models import BotSettings, SlideDirection, TradeSignal
-from bot.execution.adapters import BrokerAdapter, ExecutionResult
-
-try:
-    from selenium import webdriver
-    from selenium.common.exceptions import TimeoutException
-    from selenium.webdriver import ChromeOptions
-    from selenium.webdriver.chrome.service import Service
-    from selenium.webdriver.common.by import By
-    from selenium.webdriver.common.keys import Keys
-    from selenium.webdriver.support import expected_conditions as EC
-    from selenium.webdriver.support.ui import WebDriverWait
-except Exception:  # pragma: no cover
-    webdriver = None
-    TimeoutException = Exception
-    ChromeOptions = object
-    Service = object
-    By = object
-    Keys = object
-    EC = object
-    WebDriverWait = object
-
-
-class PocketOptionSeleniumAdapter(BrokerAdapter):
+from bot.execution.adapters import ExecutionResult
+
+webdriver = None
+TimeoutException = Exception
+ChromeOptions = object
+Service = object
+By = object
+Keys = object
+EC = object
+WebDriverWait = object
+_selenium_checked = False
+_selenium_lock = threading.Lock()
+
+
+def _ensure_selenium() -> bool:
+    # Selenium's module graph is heavy, so it is only imported once a browser
+    # action is actually requested. The UI launch worker, the health check and
+    # the auto-trade loop can all get here first, hence the lock.
+    global webdriver, TimeoutException, ChromeOptions, Service, By, Keys, EC, WebDriverWait, _selenium_checked
+    if _selenium_checked:
+        return webdriver is not None
+    with _selenium_lock:
+        if _selenium_checked:
+            return webdriver is not None
+        try:
+            from selenium import webdriver as _webdriver
+            from selenium.common.exceptions import TimeoutException as _TimeoutException
+            from selenium.webdriver import ChromeOptions as _ChromeOptions
+            from selenium.webdriver.chrome.service import Service as _Service
+            from selenium.webdriver.common.by import By as _By
+            from selenium.webdriver.common.keys import Keys as _Keys
+            from selenium.webdriver.support import expected_conditions as _EC
+            from selenium.webdriver.support.ui import WebDriverWait as _WebDriverWait
+        except Exception:  # pragma: no cover
+            _selenium_checked = True
+            return False
+        webdriver = _webdriver
+        TimeoutException = _TimeoutException
+        ChromeOptions = _ChromeOptions
+        Service = _Service
+        By = _By
+        Keys = _Keys
+        EC = _EC
+        WebDriverWait = _WebDriverWait
+        _selenium_checked = True
+        return True
+
+
+_RX_NON_DIGIT = re.compile(r"\D")
+_RX_NON_NUMERIC = re.compile(r"[^0-9,.-]")
+_RX_NON_ALNUM = re.compile(r"[^0-9a-z]")
+_RX_HHMMSS = re.compile(r"\b(\d{1,2}):(\d{2}):(\d{2})\b")
+_RX_MMSS = re.compile(r"\b(\d{1,2}):(\d{2})\b")
+_RX_SECONDS = re.compile(r"\b(\d+)\s*(sec|secs|second|seconds|s)\b")
+_RX_MINUTES = re.compile(r"\b(\d+)\s*(min|mins|minute|minutes|m)\b")
+_RX_BUY_WORDS = re.compile("buy|call|higher")
+_RX_SELL_WORDS = re.compile("sell|put|lower")
+
+# An amount input scoring this high names itself (amount, stake, ...) and is writable.
+_AMOUNT_FAST_ACCEPT_SCORE = 5
+
+# Visible switch items with their text, tried between the configured button and
+# the XPath fallbacks.
+_DIRECTION_ITEM_SELECTOR = "span.switch-state-block__item"
+_DIRECTION_ITEMS_JS = """
+var items = document.querySelectorAll(arguments[0]);
+var found = [];
+for (var i = 0; i < items.length; i++) {
+  if (items[i].getClientRects().length === 0 || items[i].disabled) continue;
+  found.push([items[i], (items[i].textContent || '').trim()]);
+}
+return found;
+"""
+
+# Settings key of the configured button and the fallbacks tried after it.
+_DIRECTION_SELECTORS: dict[SlideDirection, tuple[str, tuple[str, ...]]] = {
+    SlideDirection.BUY: (
+        "buy_button",
+        (
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[normalize-space()='Buy']]",
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'call')]]",
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'higher')]]",
+            "xpath=//button[normalize-space()='Buy']",
+        ),
+    ),
+    SlideDirection.SELL: (
+        "sell_button",
+        (
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[normalize-space()='Sell']]",
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'put')]]",
+            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'lower')]]",
+            "xpath=//button[normalize-space()='Sell']",
+        ),
+    ),
+}
+
+_PRICE_FALLBACKS = (
+    ".current-price",
+    ".asset-price",
+    ".value__val",
+    "[data-test='current-asset-price']",
+    "xpath=//*[contains(@class,'value__val')]",
+)
+_BALANCE_FALLBACKS = (
+    ".js-balance-demo",
+    ".js-balance-real-NGN",
+    ".js-balance-real-USD",
+    "xpath=//span[contains(@class,'js-balance-demo')]",
+)
+
+# Price and balance read together stay valid this long for the other getter.
+_TICK_TTL = 1.0
+
+# With keep_browser_open the launched browser keeps a DevTools port open so later
+# runs can attach to it.
+_DEFAULT_DEBUG_PORT = 9322
+_DEBUG_PORT_FILE = "browser_debug_port"
+
+# How long a confirmed trading-page URL is trusted before current_url is asked again.
+_PAGE_CHECK_TTL = 5.0
+
+_WAIT_IN_PAGE_JS = """
+var selector = arguments[0];
+var isXpath = arguments[1];
+var clickable = arguments[2];
+var deadline = Date.now() + arguments[3];
+var done = arguments[arguments.length - 1];
+
+function find() {
+  if (isXpath) {
+    return document.evaluate(selector, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+  }
+  return document.querySelector(selector);
+}
+
+function ready(el) {
+  if (!el || !el.getClientRects || el.getClientRects().length === 0) {
+    return false;
+  }
+  var style = window.getComputedStyle(el);
+  if (style.visibility === 'hidden' || style.display === 'none') {
+    return false;
+  }
+  return !clickable || !el.disabled;
+}
+
+(function tick() {
+  var el = find();
+  if (ready(el)) {
+    done(el);
+  } else if (Date.now() > deadline) {
+    done(null);
+  } else {
+    setTimeout(tick, 50);
+  }
+})();
+"""
+
+
+# Helpers installed once per page load as window.__austinbot. The native value
+# setter is looked up once, at install time.
+_PAGE_HELPERS_JS = """
+(function () {
+  var descriptor = Object.getOwnPropertyDescriptor(window.HTMLInputElement.prototype, 'value');
+  var setter = descriptor && descriptor.set;
+  window.__austinbot = {
+    // Scroll, focus and write through the native value setter so controlled
+    // inputs see the change, then return what the input actually holds.
+    write: function (el, v) {
+      if (!el) return null;
+      el.scrollIntoView({block: 'center', inline: 'center'});
+      el.focus();
+      if (setter) {
+        setter.call(el, '');
+        setter.call(el, v);
+      } else {
+        el.value = v;
+      }
+      el.dispatchEvent(new Event('input', {bubbles: true}));
+      el.dispatchEvent(new Event('change', {bubbles: true}));
+      el.dispatchEvent(new KeyboardEvent('keyup', {bubbles: true, key: 'Enter'}));
+      el.dispatchEvent(new Event('blur', {bubbles: true}));
+      el.blur();
+      return el.value;
+    },
+    // Scrolls only when the element is outside the viewport, then focuses and clicks it.
+    click: function (el) {
+      var rect = el.getBoundingClientRect();
+      if (rect.top < 0 || rect.left < 0 || rect.bottom > window.innerHeight || rect.right > window.innerWidth) {
+        el.scrollIntoView({block: 'center', inline: 'center'});
+      }
+      if (el.focus) el.focus();
+      el.click();
+      return true;
+    }
+  };
+})();
+"""
+
+_CALL_PAGE_HELPER_JS = """
+var helpers = window.__austinbot;
+var name = arguments[0];
+if (!helpers || !helpers[name]) return {missing: true};
+return {value: helpers[name].apply(null, Array.prototype.slice.call(arguments, 1))};
+"""
+
+_LOGIN_PROBE_JS = """
+function has(selector) {
+  if (!selector) return false;
+  try {
+    if (/^xpath=/i.test(selector)) {
+      var path = selector.slice(6).trim();
+      return !!document.evaluate(path, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue;
+    }
+    return !!document.querySelector(selector);
+  } catch (e) {
+    return false;
+  }
+}
+return {url: location.href, amount: has(arguments[0]), buy: has(arguments[1]), sell: has(arguments[2])};
+"""
+
+_EXPIRY_ITEM_SELECTORS = (
+    (
+        ", ".join(
+            f"{tag}[class*='{cls}']"
+            for cls in ("expiration", "item", "value")
+            for tag in ("li", "div", "span", "button")
+        ),
+        False,
+    ),
+    ("li, div, span, button", True),
+)
+# Fallback for the duration-only group when the in-page filter cannot run; the text
+# test is done by the XPath so the page is not walked element by element.
+_EXPIRY_DURATION_ITEM_XPATH = (
+    "xpath=//*[self::li or self::div or self::span or self::button]"
+    "[contains(normalize-space(),'sec') or contains(normalize-space(),'min') or contains(normalize-space(),':')]"
+)
+_RX_DURATION_TEXT = re.compile("sec|min|:")
+
+# Visible, enabled expiry options whose text holds one of the target tokens, in
+# one pass. The second flag limits a selector to text that looks like a duration.
+_EXPIRY_ITEM_CANDIDATES_JS = """
+var groups = arguments[0];
+var tokens = arguments[1];
+var seen = new Set();
+var found = [];
+groups.forEach(function (group) {
+  document.querySelectorAll(group[0]).forEach(function (el) {
+    if (seen.has(el) || el.disabled || el.getClientRects().length === 0) return;
+    var text = (el.innerText || '').trim().toLowerCase();
+    if (!text || (group[1] && !/sec|min|:/.test(text))) return;
+    if (!tokens.some(function (token) { return text.indexOf(token) !== -1; })) return;
+    var style = window.getComputedStyle(el);
+    if (style.visibility === 'hidden' || style.display === 'none') return;
+    seen.add(el);
+    found.push(el);
+  });
+});
+return found;
+"""
+
+# Visibility, enabled state, text and the requested attributes of each element.
+_ELEMENT_STATES_JS = """
+var names = arguments[1];
+return arguments[0].map(function (el) {
+  var style = window.getComputedStyle(el);
+  var attrs = {};
+  names.forEach(function (name) {
+    attrs[name] = name === 'value' ? (el.value || '') : (el.getAttribute(name) || '');
+  });
+  return {
+    displayed: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+    enabled: !el.disabled,
+    text: (el.innerText || '').trim(),
+    attrs: attrs
+  };
+});
+"""
+
+# All matches of a CSS selector or an "xpath=" locator, in document order.
+_QUERY_JS = """
+function query(selector) {
+  if (/^xpath=/i.test(selector)) {
+    var snapshot = document.evaluate(selector.slice(6).trim(), document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    var nodes = [];
+    for (var i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+  }
+  return Array.prototype.slice.call(document.querySelectorAll(selector));
+}
+"""
+
+# Elements matching any of arguments[0], grouped by the first selector that matches
+# them so earlier selectors keep priority, as _TICKER_JS does.
+_CANDIDATE_ELEMENTS_JS = _QUERY_JS + """
+var seen = new Set();
+var found = [];
+arguments[0].forEach(function (selector) {
+  var nodes;
+  try {
+    nodes = query(selector);
+  } catch (e) {
+    return;
+  }
+  nodes.forEach(function (el) {
+    if (seen.has(el)) return;
+    seen.add(el);
+    found.push(el);
+  });
+});
+return found;
+"""
+
+# A function of (priceSelectors, balanceSelectors) returning the page URL with the
+# first positive price and the first balance, parsed as _parse_float does.
+_TICKER_JS = """(function (priceSelectors, balanceSelectors) {
+""" + _QUERY_JS + """
+  function parseNumber(text) {
+    var cleaned = (text || '').replace(/[^0-9,.-]/g, '');
+    if (cleaned.indexOf(',') !== -1) {
+      cleaned = cleaned.split(',').join(cleaned.indexOf('.') !== -1 ? '' : '.');
+    }
+    if (!cleaned) return null;
+    var value = Number(cleaned);
+    return isFinite(value) ? value : null;
+  }
+
+  function first(selectors, accept) {
+    for (var s = 0; s < selectors.length; s++) {
+      if (!selectors[s]) continue;
+      var nodes;
+      try {
+        nodes = query(selectors[s]);
+      } catch (e) {
+        continue;
+      }
+      for (var n = 0; n < nodes.length; n++) {
+        var value = accept(nodes[n]);
+        if (value !== null) return value;
+      }
+    }
+    return null;
+  }
+
+  var price = first(priceSelectors, function (el) {
+    var value = parseNumber((el.innerText || '').trim());
+    return value !== null && value > 0 ? value : null;
+  });
+  var balance = first(balanceSelectors, function (el) {
+    var value = parseNumber((el.innerText || '').trim());
+    return value !== null ? value : parseNumber(el.getAttribute('data-hd-show') || '');
+  });
+  return {url: location.href, price: price, balance: balance};
+})"""
+
+# Mirrors _parse_expiry_text_to_seconds.
+_PARSE_EXPIRY_JS = """
+function parse(text) {
+  var value = (text || '').trim().toLowerCase();
+  var m = value.match(/\\b(\\d{1,2}):(\\d{2}):(\\d{2})\\b/);
+  if (m) return (+m[1]) * 3600 + (+m[2]) * 60 + (+m[3]);
+  m = value.match(/\\b(\\d{1,2}):(\\d{2})\\b/);
+  if (m) return (+m[1]) * 60 + (+m[2]);
+  m = value.match(/\\b(\\d+)\\s*(sec|secs|second|seconds|s)\\b/);
+  if (m) return +m[1];
+  m = value.match(/\\b(\\d+)\\s*(min|mins|minute|minutes|m)\\b/);
+  if (m) return (+m[1]) * 60;
+  return null;
+}
+"""
+
+_EXPIRY_DISPLAY_SELECTORS = (
+    "xpath=//div[contains(@class,'expiration-select')]//*[self::span or self::div][string-length(normalize-space()) > 0]",
+    "xpath=//*[contains(@class,'expiration') or contains(@class,'time') or contains(@class,'duration')][self::span or self::div]",
+    "xpath=//span[contains(text(),':') or contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'sec') or contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'min')]",
+)
+
+# The first visible match whose text parses as a duration, as [element, seconds].
+_FIND_EXPIRY_DISPLAY_JS = _PARSE_EXPIRY_JS + _QUERY_JS + """
+
+function visible(el) {
+  if (!el.getClientRects || el.getClientRects().length === 0) return false;
+  var style = window.getComputedStyle(el);
+  return style.visibility !== 'hidden' && style.display !== 'none';
+}
+
+var selectors = arguments[0];
+for (var s = 0; s < selectors.length; s++) {
+  if (!selectors[s]) continue;
+  var nodes;
+  try {
+    nodes = query(selectors[s]);
+  } catch (e) {
+    continue;
+  }
+  for (var n = 0; n < nodes.length; n++) {
+    if (!visible(nodes[n])) continue;
+    var seconds = parse(nodes[n].innerText);
+    if (seconds !== null) return [nodes[n], seconds];
+  }
+}
+return null;
+"""
+
+# Clicks +/- until the display shows the target, waiting up to 300ms for the
+# display to re-render after each click.
+_STEP_EXPIRY_JS = _PARSE_EXPIRY_JS + """
+var plus = arguments[0];
+var minus = arguments[1];
+var display = arguments[2];
+var target = arguments[3];
+var done = arguments[arguments.length - 1];
+var steps = 0;
+
+function step() {
+  if (!display.isConnected) {
+    done({ok: false, final: null});
+    return;
+  }
+  var current = parse(display.textContent);
+  if (current === null) {
+    done({ok: false, final: null});
+    return;
+  }
+  if (current === target || steps >= 90) {
+    done({ok: current === target, final: current});
+    return;
+  }
+  steps += 1;
+  var before = display.textContent;
+  (current < target ? plus : minus).click();
+  var waited = 0;
+  (function settle() {
+    if (display.textContent !== before || waited >= 300) {
+      step();
+      return;
+    }
+    waited += 20;
+    setTimeout(settle, 20);
+  })();
+}
+
+step();
+"""
+
+# Resolves with the display's parsed seconds once it equals (or, with
+# untilEqual false, differs from) the given value, or when the cap elapses.
+_AWAIT_EXPIRY_DISPLAY_JS = _PARSE_EXPIRY_JS + """
+var display = arguments[0];
+var seconds = arguments[1];
+var untilEqual = arguments[2];
+var cap = arguments[3];
+var done = arguments[arguments.length - 1];
+
+function settled() {
+  var current = parse(display.textContent);
+  return untilEqual ? current === seconds : current !== seconds;
+}
+
+if (!display.isConnected) {
+  done(null);
+} else if (settled()) {
+  done(parse(display.textContent));
+} else {
+  var timer = null;
+  var observer = new MutationObserver(function () {
+    if (settled()) {
+      observer.disconnect();
+      clearTimeout(timer);
+      done(parse(display.textContent));
+    }
+  });
+  observer.observe(display, {childList: true, subtree: true, characterData: true});
+  timer = setTimeout(function () {
+    observer.disconnect();
+    done(display.isConnected ? parse(display.textContent) : null);
+  }, cap);
+}
+"""
+
+
+def _is_port_open(port: int) -> bool:
+    try:
+        with socket.create_connection(("127.0.0.1", port), timeout=0.2):
+            return True
+    except OSError:
+        return False
+
+
+def _is_devtools_chrome(port: int) -> bool:
+    import urllib.request
+
+    try:
+        with urllib.request.urlopen(f"http://127.0.0.1:{port}/json/version", timeout=0.5) as response:
+            info = json.loads(response.read())
+    except Exception:
+        return False
+    if not isinstance(info, dict) or not info.get("webSocketDebuggerUrl"):
+        return False
+    return "chrome" in str(info.get("Browser") or "").lower()
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@lru_cache(maxsize=64)
+def _format_stake(stake: float) -> str:
+    # Stakes repeat between trades; "g" formatting is not used because it switches
+    # to exponent notation past six significant digits.
+    return f"{stake:.8f}".rstrip("0").rstrip(".") or str(stake)
+
+
+@lru_cache(maxsize=256)
+def _parse_locator(selector: str) -> tuple[str, str]:
+    text = selector.strip()
+    if text.lower().startswith("xpath="):
+        return (By.XPATH, text.split("=", 1)[1].strip())
+    return (By.CSS_SELECTOR, text)
+
+
+class PocketOptionSeleniumAdapter:
     def __init__(self, settings: BotSettings) -> None:
+        self._element_cache: dict[str, object] = {}
         self.settings = settings
         self._driver = None
+        self._keeps_browser = False
+        self._last_url = ""
+        self._last_url_at = 0.0
+        self._last_tick: tuple[float, float | None, float | None] | None = None
+
+    @property
+    def settings(self) -> BotSettings:
+        return self._settings
+
+    @settings.setter
+    def settings(self, settings: BotSettings) -> None:
+        self._settings = settings
+        self._element_cache.clear()
+        selectors = settings.broker_selectors
+        self._selectors: dict[str, str] = {key: (value or "").strip() for key, value in selectors.items()}
+        pair_template = selectors.get("pair_item")
+        expiry_template = selectors.get("expiry_item")
+        self._pair_selectors: dict[str, str] = (
+            {pair: pair_template.format(pair=pair) for pair in settings.enabled_pairs} if pair_template else {}
+        )
+        self._expiry_selectors: dict[str, str] = (
+            {
+                expiry: expiry_template.format(expiry=expiry)
+                for expiry_list in settings.pair_expiry_rules.values()
+                for expiry in expiry_list
+            }
+            if expiry_template
+            else {}
+        )
 
     @property
     def name(self) -> str:
         return "broker_plugin"
 
-    def execute_signal(self, signal: TradeSignal, stake: float) -> ExecutionResult:
+    def execute_signal(self, signal: TradeSignal, stake: float, *, now: datetime | None = None) -> ExecutionResult:
         if self.settings.broker_dry_run:
             return ExecutionResult(
                 accepted=True,
@@ -50,17 +587,17 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 pair=signal.pair,
                 direction=signal.direction,
                 expiry=signal.expiry,
-                executed_at=datetime.utcnow(),
+                executed_at=now or datetime.utcnow(),
             )
 
-        if webdriver is None:
+        if not _ensure_selenium():
             return ExecutionResult(
                 accepted=False,
                 message="Selenium is not installed. Install with: pip install selenium webdriver-manager",
                 pair=signal.pair,
                 direction=signal.direction,
                 expiry=signal.expiry,
-                executed_at=datetime.utcnow(),
+                executed_at=now or datetime.utcnow(),
             )
 
         try:
@@ -77,7 +614,7 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                     pair=signal.pair,
                     direction=signal.direction,
                     expiry=signal.expiry,
-                    executed_at=datetime.utcnow(),
+                    executed_at=now or datetime.utcnow(),
                 )
 
             try:
@@ -105,7 +642,7 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 pair=signal.pair,
                 direction=signal.direction,
                 expiry=signal.expiry,
-                executed_at=datetime.utcnow(),
+                executed_at=now or datetime.utcnow(),
             )
         except Exception as exc:
             return ExecutionResult(
@@ -114,15 +651,45 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 pair=signal.pair,
                 direction=signal.direction,
                 expiry=signal.expiry,
-                executed_at=datetime.utcnow(),
+                executed_at=now or datetime.utcnow(),
             )
 
     def _ensure_driver(self):
         if self._driver is not None:
             return self._driver
+        if not _ensure_selenium():
+            raise RuntimeError("Selenium is not installed. Install with: pip install selenium webdriver-manager")
 
         browser_profile_dir = self._browser_profile_dir()
+        if not self.settings.keep_browser_open:
+            self._driver = self._start_driver(self._launch_options(browser_profile_dir, None))
+            self._keeps_browser = False
+            return self._driver
 
+        debug_port = self._read_debug_port(browser_profile_dir)
+        if _is_devtools_chrome(debug_port):
+            # A browser from an earlier run is still up with the profile and login.
+            options = ChromeOptions()
+            options.debugger_address = f"127.0.0.1:{debug_port}"
+            try:
+                self._driver = self._start_driver(options)
+            except Exception as exc:
+                # That browser holds the profile lock, so a fresh launch on the same
+                # profile would only hand off to it and fail with "session not created".
+                raise RuntimeError(
+                    f"A Chrome window from an earlier run (DevTools port {debug_port}) still holds the "
+                    "bot's browser profile and could not be attached. Close that browser and try again."
+                ) from exc
+            self._keeps_browser = True
+            return self._driver
+        if _is_port_open(debug_port):
+            debug_port = _free_port()
+        self._write_debug_port(browser_profile_dir, debug_port)
+        self._driver = self._start_driver(self._launch_options(browser_profile_dir, debug_port))
+        self._keeps_browser = True
+        return self._driver
+
+    def _launch_options(self, browser_profile_dir: Path | None, debug_port: int | None):
         options = ChromeOptions()
         options.add_experimental_option("excludeSwitches", ["enable-logging", "enable-automation"])
         options.add_experimental_option("useAutomationExtension", False)
@@ -132,14 +699,54 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         options.add_argument("--no-first-run")
         options.add_argument("--log-level=3")
         options.add_argument("--start-maximized")
+        if debug_port is not None:
+            options.add_experimental_option("detach", True)
+            options.add_argument(f"--remote-debugging-port={debug_port}")
         if browser_profile_dir is not None:
             options.add_argument(f"--user-data-dir={browser_profile_dir}")
             options.add_argument("--profile-directory=Default")
+        return options
+
+    def _start_driver(self, options):
         service = Service(log_output=subprocess.DEVNULL)
         service.creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0)
         os.environ["WDM_LOG"] = "0"
-        self._driver = webdriver.Chrome(service=service, options=options)
-        return self._driver
+        return webdriver.Chrome(service=service, options=options)
+
+    def close(self) -> None:
+        driver = self._driver
+        if driver is None:
+            return
+        self._driver = None
+        self._element_cache.clear()
+        self._last_url = ""
+        self._last_url_at = 0.0
+        self._last_tick = None
+        try:
+            if self._keeps_browser:
+                # Only chromedriver goes away; the detached browser stays up for the next run.
+                driver.service.stop()
+            else:
+                driver.quit()
+        except Exception:
+            pass
+
+    def _read_debug_port(self, browser_profile_dir: Path | None) -> int:
+        if browser_profile_dir is None:
+            return _DEFAULT_DEBUG_PORT
+        try:
+            port = int((browser_profile_dir.parent / _DEBUG_PORT_FILE).read_text(encoding="utf-8").strip())
+        except Exception:
+            return _DEFAULT_DEBUG_PORT
+        return port if 0 < port < 65536 else _DEFAULT_DEBUG_PORT
+
+    def _write_debug_port(self, browser_profile_dir: Path | None, port: int) -> None:
+        if browser_profile_dir is None:
+            return
+        try:
+            (browser_profile_dir.parent / _DEBUG_PORT_FILE).write_text(str(port), encoding="utf-8")
+        except Exception:
+            pass
 
     def _browser_profile_dir(self) -> Path | None:
         local_appdata = os.getenv("LOCALAPPDATA", "").strip()
@@ -162,7 +769,7 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             return None
 
     def open_session(self) -> str:
-        if webdriver is None:
+        if not _ensure_selenium():
             return "Selenium not installed. Run: pip install selenium webdriver-manager"
         try:
             driver = self._ensure_driver()
@@ -173,18 +780,18 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
     def selector_health_check(self) -> dict[str, bool]:
         checks: dict[str, bool] = {}
-        if webdriver is None:
+        if not _ensure_selenium():
             return {"selenium": False}
 
         driver = self._ensure_driver()
         self._ensure_page_open(driver)
 
         selector_map = {
-            "amount_input": self.settings.broker_selectors.get("amount_input", ""),
-            "buy_button": self.settings.broker_selectors.get("buy_button", ""),
-            "sell_button": self.settings.broker_selectors.get("sell_button", ""),
-            "pair_dropdown": self.settings.broker_selectors.get("pair_dropdown", ""),
-            "expiry_dropdown": self.settings.broker_selectors.get("expiry_dropdown", ""),
+            "amount_input": self._selectors.get("amount_input", ""),
+            "buy_button": self._selectors.get("buy_button", ""),
+            "sell_button": self._selectors.get("sell_button", ""),
+            "pair_dropdown": self._selectors.get("pair_dropdown", ""),
+            "expiry_dropdown": self._selectors.get("expiry_dropdown", ""),
         }
 
         for key, selector in selector_map.items():
@@ -200,12 +807,14 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         return checks
 
     def is_logged_in(self) -> bool:
-        if webdriver is None:
+        if not _ensure_selenium():
             return False
 
         try:
             driver = self._ensure_driver()
-            current_url = (driver.current_url or "").lower()
+            current_url, has_amount, has_buy, has_sell = self._probe_login_state(driver)
+            self._remember_url(current_url)
+            current_url = current_url.lower()
 
             if "accounts.google.com" in current_url:
                 return False
@@ -216,22 +825,6 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             if any(tag in current_url for tag in ["login", "sign", "auth"]):
                 return False
 
-            amount_selector = self.settings.broker_selectors.get("amount_input", "")
-            buy_selector = self.settings.broker_selectors.get("buy_button", "")
-            sell_selector = self.settings.broker_selectors.get("sell_button", "")
-
-            def _has(selector: str) -> bool:
-                if not selector:
-                    return False
-                try:
-                    return len(self._find_elements(driver, selector)) > 0
-                except Exception:
-                    return False
-
-            has_amount = _has(amount_selector)
-            has_buy = _has(buy_selector)
-            has_sell = _has(sell_selector)
-
             if has_amount and (has_buy or has_sell):
                 return True
 
@@ -242,31 +835,131 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         except Exception:
             return False
 
+    def _probe_login_state(self, driver) -> tuple[str, bool, bool, bool]:
+        amount_selector = self._selectors.get("amount_input", "")
+        buy_selector = self._selectors.get("buy_button", "")
+        sell_selector = self._selectors.get("sell_button", "")
+
+        try:
+            probe = driver.execute_script(_LOGIN_PROBE_JS, amount_selector, buy_selector, sell_selector)
+        except Exception:
+            probe = None
+        if isinstance(probe, dict):
+            return (
+                str(probe.get("url") or ""),
+                bool(probe.get("amount")),
+                bool(probe.get("buy")),
+                bool(probe.get("sell")),
+            )
+
+        def _has(selector: str) -> bool:
+            if not selector:
+                return False
+            try:
+                return len(self._find_elements(driver, selector)) > 0
+            except Exception:
+                return False
+
+        return (driver.current_url or "", _has(amount_selector), _has(buy_selector), _has(sell_selector))
+
     def _ensure_page_open(self, driver) -> None:
-        current_url = (driver.current_url or "").lower()
-        if "pocketoption.com" in current_url and "/cabinet/" in current_url:
+        now = time.monotonic()
+        if now - self._last_url_at < _PAGE_CHECK_TTL and self._is_cabinet_url(self._last_url):
             return
-        if self.settings.pocket_option_url not in driver.current_url:
+        current_url = driver.current_url or ""
+        self._remember_url(current_url, now)
+        if self._is_cabinet_url(current_url):
+            return
+        if self.settings.pocket_option_url not in current_url:
+            self._element_cache.clear()
+            self._last_url = ""
             driver.get(self.settings.pocket_option_url)
 
+    def _current_url(self, driver) -> str:
+        # Any URL seen in the last _PAGE_CHECK_TTL seconds answers domain checks.
+        if self._last_url and time.monotonic() - self._last_url_at < _PAGE_CHECK_TTL:
+            return self._last_url
+        self._remember_url(driver.current_url or "")
+        return self._last_url
+
+    def _remember_url(self, url: str, at: float | None = None) -> None:
+        self._last_url = url
+        self._last_url_at = time.monotonic() if at is None else at
+
+    @staticmethod
+    def _is_cabinet_url(url: str) -> bool:
+        url = url.lower()
+        return "pocketoption.com" in url and "/cabinet/" in url
+
+    def _cached_element(self, key: str):
+        element = self._element_cache.get(key)
+        if element is None:
+            return None
+        try:
+            if element.is_displayed() and element.is_enabled():
+                return element
+        except Exception:
+            pass
+        # Stale after a re-render, or hidden/disabled: locate it again.
+        self._element_cache.pop(key, None)
+        return None
+
     def _wait_clickable(self, driver, selector: str, timeout: int = 20):
+        element = self._wait_in_page(driver, selector, clickable=True, timeout=timeout)
+        if element is not None:
+            return element
         return WebDriverWait(driver, timeout).until(EC.element_to_be_clickable(self._locator_from_selector(selector)))
 
     def _wait_visible(self, driver, selector: str, timeout: int = 20):
+        element = self._wait_in_page(driver, selector, clickable=False, timeout=timeout)
+        if element is not None:
+            return element
         return WebDriverWait(driver, timeout).until(EC.visibility_of_element_located(self._locator_from_selector(selector)))
 
+    def _wait_in_page(self, driver, selector: str, clickable: bool, timeout: float):
+        # Polls every 50ms inside the page rather than every 500ms over the wire.
+        # None means the script could not run and the caller should use WebDriverWait.
+        by, value = self._locator_from_selector(selector)
+        try:
+            element = self._execute_async_script(
+                driver,
+                timeout + 1,
+                _WAIT_IN_PAGE_JS,
+                value,
+                by == By.XPATH,
+                clickable,
+                int(timeout * 1000),
+            )
+        except TimeoutException:
+            raise
+        except Exception:
+            return None
+        if element is None:
+            raise TimeoutException(f"Timed out waiting for {selector}")
+        return element
+
+    @staticmethod
+    def _execute_async_script(driver, timeout: float, script: str, *args):
+        # The async-script timeout is session-wide, so it is put back for later callers.
+        previous = driver.timeouts.script
+        driver.set_script_timeout(timeout)
+        try:
+            return driver.execute_async_script(script, *args)
+        finally:
+            try:
+                driver.set_script_timeout(previous)
+            except Exception:
+                pass
+
     def _locator_from_selector(self, selector: str):
-        text = selector.strip()
-        if text.lower().startswith("xpath="):
-            return (By.XPATH, text.split("=", 1)[1].strip())
-        return (By.CSS_SELECTOR, text)
+        return _parse_locator(selector)
 
     def _find_elements(self, driver, selector: str):
         by, value = self._locator_from_selector(selector)
         return driver.find_elements(by, value)
 
     def _set_trade_amount(self, driver, stake: float) -> None:
-        configured = self.settings.broker_selectors.get("amount_input", "")
+        configured = self._selectors.get("amount_input", "")
         candidates = [
             configured,
             "input[type='text'][autocomplete='off']",
@@ -277,12 +970,12 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             "xpath=//input[contains(@inputmode,'decimal') and not(@type='hidden')]",
         ]
 
-        stake_text = (f"{stake:.8f}").rstrip("0").rstrip(".")
-        if not stake_text:
-            stake_text = str(stake)
+        stake_text = _format_stake(float(stake))
 
+        # Write to the first confidently-named input straight away; only rank the
+        # remaining selectors' matches when none of them qualifies.
         ranked_inputs: list[tuple[int, object]] = []
-
+        tried: object | None = None
         for selector in candidates:
             if not selector:
                 continue
@@ -290,26 +983,77 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 elements = self._find_elements(driver, selector)
             except Exception:
                 continue
-
-            for element in elements:
-                try:
-                    if not element.is_displayed() or not element.is_enabled():
-                        continue
-                    score = self._score_amount_input_candidate(element)
-                    ranked_inputs.append((score, element))
-                except Exception:
-                    continue
+            ranked = self._rank_amount_inputs(driver, elements)
+            if not ranked:
+                continue
+            if tried is None:
+                score, element = max(ranked, key=lambda item: item[0])
+                if score >= _AMOUNT_FAST_ACCEPT_SCORE:
+                    if self._try_write_amount(driver, element, stake_text, float(stake)):
+                        return
+                    tried = element
+            ranked_inputs.extend(ranked)
 
         ranked_inputs.sort(key=lambda item: item[0], reverse=True)
 
         for _, element in ranked_inputs:
+            if element is tried:
+                continue
             if self._try_write_amount(driver, element, stake_text, float(stake)):
                 return
 
         raise RuntimeError("Unable to set trade amount in broker UI")
 
+    def _rank_amount_inputs(self, driver, elements: list) -> list[tuple[int, object]]:
+        if not elements:
+            return []
+
+        # One round trip for every candidate instead of eight WebDriver calls each.
+        try:
+            infos = driver.execute_script(
+                """
+                return arguments[0].map(function (el) {
+                  var style = window.getComputedStyle(el);
+                  return {
+                    text: [el.id, el.name, el.className, el.placeholder,
+                           el.getAttribute('aria-label'), el.getAttribute('data-test')]
+                      .map(function (v) { return typeof v === 'string' ? v : ''; }).join(' '),
+                    value: el.value || '',
+                    readonly: !!el.readOnly,
+                    displayed: el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none',
+                    enabled: !el.disabled
+                  };
+                });
+                """,
+                elements,
+            )
+        except Exception:
+            infos = None
+
+        ranked_inputs: list[tuple[int, object]] = []
+        if isinstance(infos, list) and len(infos) == len(elements):
+            for element, info in zip(elements, infos):
+                if not info or not info.get("displayed") or not info.get("enabled"):
+                    continue
+                score = self._score_amount_input(
+                    str(info.get("text") or ""),
+                    str(info.get("value") or ""),
+                    bool(info.get("readonly")),
+                )
+                ranked_inputs.append((score, element))
+            return ranked_inputs
+
+        for element in elements:
+            try:
+                if not element.is_displayed() or not element.is_enabled():
+                    continue
+                score = self._score_amount_input_candidate(element)
+                ranked_inputs.append((score, element))
+            except Exception:
+                continue
+        return ranked_inputs
+
     def _score_amount_input_candidate(self, element) -> int:
-        score = 0
         attrs = [
             element.get_attribute("id") or "",
             element.get_attribute("name") or "",
@@ -318,33 +1062,54 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             element.get_attribute("aria-label") or "",
             element.get_attribute("data-test") or "",
         ]
-        text = " ".join(attrs).lower()
+        return self._score_amount_input(
+            " ".join(attrs),
+            element.get_attribute("value") or "",
+            (element.get_attribute("readonly") or "").lower() in {"true", "readonly"},
+        )
+
+    def _score_amount_input(self, text: str, value: str, readonly: bool) -> int:
+        score = 0
+        text = text.lower()
 
         keywords = ("amount", "stake", "investment", "sum", "bet", "trade")
         for keyword in keywords:
             if keyword in text:
                 score += 5
 
-        value = (element.get_attribute("value") or "").strip()
-        if self._parse_float(value) is not None:
+        if self._parse_float(value.strip()) is not None:
             score += 2
 
-        if (element.get_attribute("readonly") or "").lower() in {"true", "readonly"}:
+        if readonly:
             score -= 10
 
         return score
 
+    def _call_page_helper(self, driver, name: str, *args):
+        result = driver.execute_script(_CALL_PAGE_HELPER_JS, name, *args)
+        if isinstance(result, dict) and result.get("missing"):
+            # First call since the page (re)loaded: install the helpers and retry.
+            result = driver.execute_script(_PAGE_HELPERS_JS + _CALL_PAGE_HELPER_JS, name, *args)
+        if not isinstance(result, dict) or result.get("missing"):
+            raise RuntimeError(f"Page helper '{name}' is unavailable")
+        return result.get("value")
+
+    def _click(self, driver, element) -> None:
+        try:
+            self._call_page_helper(driver, "click", element)
+        except Exception:
+            element.click()
+
     def _try_write_amount(self, driver, element, stake_text: str, stake_value: float) -> bool:
         try:
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", element)
-            except Exception:
-                pass
+            written = self._call_page_helper(driver, "write", element, stake_text)
+            if isinstance(written, str) and self._amount_applied(written, stake_text, stake_value):
+                return True
+        except Exception:
+            pass
 
-            try:
-                element.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", element)
+        try:
+            self._click(driver, element)
 
             element.send_keys(Keys.CONTROL, "a")
             element.send_keys(Keys.BACKSPACE)
@@ -371,39 +1136,51 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 stake_text,
             )
 
-            current_value = element.get_attribute("value") or ""
-            parsed = self._parse_float(current_value)
-            if parsed is not None and abs(parsed - stake_value) < 0.001:
-                return True
-
-            if stake_text in current_value:
-                return True
-
-            return False
+            return self._amount_applied(element.get_attribute("value") or "", stake_text, stake_value)
         except Exception:
             return False
 
+    def _amount_applied(self, current_value: str, stake_text: str, stake_value: float) -> bool:
+        parsed = self._parse_float(current_value)
+        if parsed is not None and abs(parsed - stake_value) < 0.001:
+            return True
+        return stake_text in current_value
+
     def _set_pair(self, driver, pair: str) -> None:
-        pair_dropdown_selector = self.settings.broker_selectors.get("pair_dropdown")
-        pair_search_selector = self.settings.broker_selectors.get("pair_search")
-        pair_item_template = self.settings.broker_selectors.get("pair_item")
+        pair_dropdown_selector = self._selectors.get("pair_dropdown")
+        pair_search_selector = self._selectors.get("pair_search")
+        pair_item_template = self._selectors.get("pair_item")
 
         if not pair_dropdown_selector or not pair_search_selector or not pair_item_template:
             return
 
+        if self._is_pair_selected(driver, pair_dropdown_selector, pair):
+            return
+
         try:
             self._wait_clickable(driver, pair_dropdown_selector).click()
             search_input = self._wait_visible(driver, pair_search_selector)
             search_input.send_keys(Keys.CONTROL, "a")
             search_input.send_keys(pair)
-            pair_item_selector = pair_item_template.format(pair=pair)
+            pair_item_selector = self._pair_selectors.get(pair) or pair_item_template.format(pair=pair)
             self._wait_clickable(driver, pair_item_selector).click()
         except TimeoutException:
             pass
 
+    def _is_pair_selected(self, driver, pair_dropdown_selector: str, pair: str) -> bool:
+        # "EURUSD_otc" and a displayed "EUR/USD OTC" both normalise to "eurusdotc".
+        try:
+            elements = self._find_elements(driver, pair_dropdown_selector)
+            if not elements:
+                return False
+            current = _RX_NON_ALNUM.sub("", (elements[0].text or "").lower())
+        except Exception:
+            return False
+        return bool(current) and current == _RX_NON_ALNUM.sub("", pair.lower())
+
     def _set_expiry(self, driver, expiry: str) -> None:
-        expiry_dropdown_selector = self.settings.broker_selectors.get("expiry_dropdown")
-        expiry_item_template = self.settings.broker_selectors.get("expiry_item")
+        expiry_dropdown_selector = self._selectors.get("expiry_dropdown")
+        expiry_item_template = self._selectors.get("expiry_item")
         target_tokens = self._expiry_tokens(expiry)
         target_seconds = self._expiry_to_seconds(expiry)
 
@@ -432,41 +1209,18 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
         if expiry_item_template:
             try:
-                expiry_item_selector = expiry_item_template.format(expiry=expiry)
+                expiry_item_selector = self._expiry_selectors.get(expiry) or expiry_item_template.format(expiry=expiry)
                 self._wait_clickable(driver, expiry_item_selector, timeout=4).click()
                 if target_seconds is None or self._is_expiry_target_applied(driver, target_seconds):
                     return
             except Exception:
                 pass
 
-        item_candidates = [
-            "xpath=//*[self::li or self::div or self::span or self::button][contains(@class,'expiration') or contains(@class,'item') or contains(@class,'value')]",
-            "xpath=//*[self::li or self::div or self::span or self::button][contains(normalize-space(),'sec') or contains(normalize-space(),'min') or contains(normalize-space(),':')]",
-        ]
-
-        for selector in item_candidates:
+        for element in self._find_expiry_items(driver, target_tokens):
             try:
-                for element in self._find_elements(driver, selector):
-                    try:
-                        if not element.is_displayed() or not element.is_enabled():
-                            continue
-                        text = ((element.text or "").strip()).lower()
-                        if not text:
-                            continue
-                        if not any(token in text for token in target_tokens):
-                            continue
-                        try:
-                            driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", element)
-                        except Exception:
-                            pass
-                        try:
-                            element.click()
-                        except Exception:
-                            driver.execute_script("arguments[0].click();", element)
-                        if target_seconds is None or self._is_expiry_target_applied(driver, target_seconds):
-                            return
-                    except Exception:
-                        continue
+                self._click(driver, element)
+                if target_seconds is None or self._is_expiry_target_applied(driver, target_seconds):
+                    return
             except Exception:
                 continue
 
@@ -475,6 +1229,62 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
         raise RuntimeError(f"Unable to set expiry '{expiry}' in broker UI")
 
+    def _find_expiry_items(self, driver, target_tokens: tuple[str, ...]) -> list:
+        tokens = [token.lower() for token in target_tokens]
+        try:
+            found = driver.execute_script(_EXPIRY_ITEM_CANDIDATES_JS, [list(group) for group in _EXPIRY_ITEM_SELECTORS], tokens)
+            if isinstance(found, list):
+                return found
+        except Exception:
+            pass
+
+        items: list = []
+        for selector, duration_only in _EXPIRY_ITEM_SELECTORS:
+            if duration_only:
+                selector = _EXPIRY_DURATION_ITEM_XPATH
+            try:
+                elements = self._find_elements(driver, selector)
+            except Exception:
+                continue
+            states = self._element_states(driver, elements)
+            if states is not None:
+                for element, state in zip(elements, states):
+                    if not state.get("displayed") or not state.get("enabled"):
+                        continue
+                    text = str(state.get("text") or "").lower()
+                    if self._expiry_item_text_ok(text, tokens, duration_only):
+                        items.append(element)
+                continue
+            for element in elements:
+                try:
+                    if not element.is_displayed() or not element.is_enabled():
+                        continue
+                    text = ((element.text or "").strip()).lower()
+                    if self._expiry_item_text_ok(text, tokens, duration_only):
+                        items.append(element)
+                except Exception:
+                    continue
+        return items
+
+    @staticmethod
+    def _expiry_item_text_ok(text: str, tokens: list[str], duration_only: bool) -> bool:
+        # Mirrors the text checks in _EXPIRY_ITEM_CANDIDATES_JS.
+        if not text or (duration_only and not _RX_DURATION_TEXT.search(text)):
+            return False
+        return any(token in text for token in tokens)
+
+    def _element_states(self, driver, elements: list, attributes: tuple[str, ...] = ()) -> list[dict] | None:
+        # One round trip for the whole list instead of several WebDriver calls per element.
+        if not elements:
+            return []
+        try:
+            states = driver.execute_script(_ELEMENT_STATES_JS, elements, list(attributes))
+        except Exception:
+            return None
+        if not isinstance(states, list) or len(states) != len(elements):
+            return None
+        return [state if isinstance(state, dict) else {} for state in states]
+
     def _expiry_tokens(self, expiry: str) -> tuple[str, ...]:
         value = (expiry or "").strip().upper()
         if value.startswith("S"):
@@ -506,8 +1316,8 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         return self._parse_expiry_text_to_seconds(value)
 
     def _set_expiry_via_time_inputs(self, driver, target_seconds: int) -> bool:
-        minute_selector = self.settings.broker_selectors.get("expiry_minute_input", "").strip()
-        second_selector = self.settings.broker_selectors.get("expiry_second_input", "").strip()
+        minute_selector = self._selectors.get("expiry_minute_input", "")
+        second_selector = self._selectors.get("expiry_second_input", "")
 
         minute_input = None
         second_input = None
@@ -533,15 +1343,28 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
         minutes = target_seconds // 60
         seconds = target_seconds % 60
+        display = self._find_expiry_display(driver)
 
         ok_min = self._write_time_input(driver, minute_input, f"{minutes:02d}")
         ok_sec = self._write_time_input(driver, second_input, f"{seconds:02d}")
         if not (ok_min and ok_sec):
             return False
 
-        time.sleep(0.08)
+        shown = None
+        if display is not None:
+            shown = self._await_expiry_display(driver, display[0], target_seconds, until_equal=True)
+        if shown == target_seconds:
+            return True
+        if shown is None:
+            time.sleep(0.08)
         return self._is_expiry_target_applied(driver, target_seconds)
 
+    def _await_expiry_display(self, driver, display, seconds: int, until_equal: bool, cap_ms: int = 200) -> int | None:
+        try:
+            return driver.execute_async_script(_AWAIT_EXPIRY_DISPLAY_JS, display, seconds, until_equal, cap_ms)
+        except Exception:
+            return None
+
     def _visible_time_inputs(self, driver) -> list:
         selectors = [
             "xpath=//input[@type='text' and @autocomplete='off']",
@@ -553,34 +1376,44 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 elements = self._find_elements(driver, selector)
             except Exception:
                 continue
-            for element in elements:
-                try:
-                    if not element.is_displayed() or not element.is_enabled():
+            states = self._element_states(driver, elements, ("value", "maxlength"))
+            if states is not None:
+                for element, state in zip(elements, states):
+                    if not state.get("displayed") or not state.get("enabled"):
                         continue
-                    value = (element.get_attribute("value") or "").strip()
-                    maxlength = (element.get_attribute("maxlength") or "").strip()
-                    if maxlength and self._parse_float(maxlength) is not None and int(float(maxlength)) <= 2:
+                    attrs = state.get("attrs") or {}
+                    if self._is_time_input(str(attrs.get("value") or ""), str(attrs.get("maxlength") or "")):
                         candidates.append(element)
+            else:
+                for element in elements:
+                    try:
+                        if not element.is_displayed() or not element.is_enabled():
+                            continue
+                        if self._is_time_input(element.get_attribute("value") or "", element.get_attribute("maxlength") or ""):
+                            candidates.append(element)
+                    except Exception:
                         continue
-                    if value.isdigit() and len(value) <= 2:
-                        candidates.append(element)
-                except Exception:
-                    continue
             if len(candidates) >= 2:
                 break
         return candidates
 
+    def _is_time_input(self, value: str, maxlength: str) -> bool:
+        value = value.strip()
+        maxlength = maxlength.strip()
+        if maxlength and self._parse_float(maxlength) is not None and int(float(maxlength)) <= 2:
+            return True
+        return value.isdigit() and len(value) <= 2
+
     def _write_time_input(self, driver, element, value: str) -> bool:
         try:
-            try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", element)
-            except Exception:
-                pass
+            written = self._call_page_helper(driver, "write", element, value)
+            if isinstance(written, str) and self._time_input_applied(written.strip(), value):
+                return True
+        except Exception:
+            pass
 
-            try:
-                element.click()
-            except Exception:
-                driver.execute_script("arguments[0].click();", element)
+        try:
+            self._click(driver, element)
 
             element.send_keys(Keys.CONTROL, "a")
             element.send_keys(Keys.BACKSPACE)
@@ -607,19 +1440,19 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                 value,
             )
 
-            current = (element.get_attribute("value") or "").strip()
-            if current.endswith(value) or current == value:
-                return True
-
-            current_digits = re.sub(r"\D", "", current)
-            target_digits = re.sub(r"\D", "", value)
-            if current_digits and target_digits and int(current_digits) == int(target_digits):
-                return True
-
-            return False
+            return self._time_input_applied((element.get_attribute("value") or "").strip(), value)
         except Exception:
             return False
 
+    @staticmethod
+    def _time_input_applied(current: str, value: str) -> bool:
+        if current.endswith(value) or current == value:
+            return True
+
+        current_digits = _RX_NON_DIGIT.sub("", current)
+        target_digits = _RX_NON_DIGIT.sub("", value)
+        return bool(current_digits and target_digits and int(current_digits) == int(target_digits))
+
     @staticmethod
     def _first_visible_enabled(elements):
         for element in elements:
@@ -637,12 +1470,19 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         return current_seconds == target_seconds
 
     def _read_current_expiry_seconds(self, driver) -> int | None:
-        selectors = [
-            self.settings.broker_selectors.get("expiry_value", "").strip(),
-            "xpath=//div[contains(@class,'expiration-select')]//*[self::span or self::div][string-length(normalize-space()) > 0]",
-            "xpath=//*[contains(@class,'expiration') or contains(@class,'time') or contains(@class,'duration')][self::span or self::div]",
-            "xpath=//span[contains(text(),':') or contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'sec') or contains(translate(text(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'min')]",
-        ]
+        display = self._find_expiry_display(driver)
+        return display[1] if display is not None else None
+
+    def _find_expiry_display(self, driver) -> tuple[object, int] | None:
+        selectors = [self._selectors.get("expiry_value", ""), *_EXPIRY_DISPLAY_SELECTORS]
+        try:
+            found = driver.execute_script(_FIND_EXPIRY_DISPLAY_JS, selectors)
+            if isinstance(found, list) and len(found) == 2:
+                return found[0], int(found[1])
+            if found is None:
+                return None
+        except Exception:
+            pass
 
         for selector in selectors:
             if not selector:
@@ -659,7 +1499,7 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
                     text = (element.text or "").strip()
                     seconds = self._parse_expiry_text_to_seconds(text)
                     if seconds is not None:
-                        return seconds
+                        return element, seconds
                 except Exception:
                     continue
 
@@ -671,24 +1511,24 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
         value = text.strip().lower()
 
-        hhmmss = re.search(r"\b(\d{1,2}):(\d{2}):(\d{2})\b", value)
+        hhmmss = _RX_HHMMSS.search(value)
         if hhmmss:
             hours = int(hhmmss.group(1))
             minutes = int(hhmmss.group(2))
             seconds = int(hhmmss.group(3))
             return (hours * 3600) + (minutes * 60) + seconds
 
-        mmss = re.search(r"\b(\d{1,2}):(\d{2})\b", value)
+        mmss = _RX_MMSS.search(value)
         if mmss:
             minutes = int(mmss.group(1))
             seconds = int(mmss.group(2))
             return (minutes * 60) + seconds
 
-        sec_word = re.search(r"\b(\d+)\s*(sec|secs|second|seconds|s)\b", value)
+        sec_word = _RX_SECONDS.search(value)
         if sec_word:
             return int(sec_word.group(1))
 
-        min_word = re.search(r"\b(\d+)\s*(min|mins|minute|minutes|m)\b", value)
+        min_word = _RX_MINUTES.search(value)
         if min_word:
             return int(min_word.group(1)) * 60
 
@@ -700,41 +1540,53 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         if plus is None or minus is None:
             return False
 
+        display = self._find_expiry_display(driver)
+        if display is None:
+            return False
+        if display[1] == target_seconds:
+            return True
+
+        try:
+            result = self._execute_async_script(driver, 35, _STEP_EXPIRY_JS, plus, minus, display[0], target_seconds)
+        except Exception:
+            result = None
+        if isinstance(result, dict) and result.get("final") is not None:
+            return bool(result.get("ok")) or self._is_expiry_target_applied(driver, target_seconds)
+
         for _ in range(90):
-            current_seconds = self._read_current_expiry_seconds(driver)
-            if current_seconds is None:
+            display = self._find_expiry_display(driver)
+            if display is None:
                 return False
+            display_element, current_seconds = display
             if current_seconds == target_seconds:
                 return True
 
             control = plus if current_seconds < target_seconds else minus
 
             try:
-                driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", control)
+                self._click(driver, control)
             except Exception:
-                pass
-
-            try:
-                control.click()
-            except Exception:
-                try:
-                    driver.execute_script("arguments[0].click();", control)
-                except Exception:
-                    return False
+                return False
 
-            time.sleep(0.06)
+            if self._await_expiry_display(driver, display_element, current_seconds, until_equal=False) is None:
+                time.sleep(0.06)
 
         return self._is_expiry_target_applied(driver, target_seconds)
 
     def _find_expiry_step_control(self, driver, increase: bool):
+        cache_key = "expiry_plus" if increase else "expiry_minus"
+        cached = self._cached_element(cache_key)
+        if cached is not None:
+            return cached
+
         if increase:
             selectors = [
-                self.settings.broker_selectors.get("expiry_plus", "").strip(),
+                self._selectors.get("expiry_plus", ""),
                 "xpath=//*[self::button or self::span or self::div][contains(@class,'btn-plus') or contains(@class,'plus') or @data-action='plus' or contains(translate(@aria-label,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'plus')]",
             ]
         else:
             selectors = [
-                self.settings.broker_selectors.get("expiry_minus", "").strip(),
+                self._selectors.get("expiry_minus", ""),
                 "xpath=//*[self::button or self::span or self::div][contains(@class,'btn-minus') or contains(@class,'minus') or @data-action='minus' or contains(translate(@aria-label,'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'minus')]",
             ]
 
@@ -749,6 +1601,7 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             for element in elements:
                 try:
                     if element.is_displayed() and element.is_enabled():
+                        self._element_cache[cache_key] = element
                         return element
                 except Exception:
                     continue
@@ -756,41 +1609,26 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
         return None
 
     def _click_direction(self, driver, direction: SlideDirection) -> None:
-        configured = self.settings.broker_selectors["buy_button"]
-        fallbacks = [
-            configured,
-            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[normalize-space()='Buy']]",
-            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'call')]]",
-            "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'higher')]]",
-            "xpath=//button[normalize-space()='Buy']",
-        ]
-        if direction == SlideDirection.SELL:
-            configured = self.settings.broker_selectors["sell_button"]
-            fallbacks = [
-                configured,
-                "xpath=//span[contains(@class,'switch-state-block__item')][.//*[normalize-space()='Sell']]",
-                "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'put')]]",
-                "xpath=//span[contains(@class,'switch-state-block__item')][.//*[contains(translate(normalize-space(),'ABCDEFGHIJKLMNOPQRSTUVWXYZ','abcdefghijklmnopqrstuvwxyz'),'lower')]]",
-                "xpath=//button[normalize-space()='Sell']",
-            ]
+        selector_key, fallbacks = _DIRECTION_SELECTORS[direction]
+        configured = self._selectors[selector_key]
 
+        # The BUY/SELL handle is located and its label checked on every click: the switch
+        # can re-render and reuse the same node with the other label.
         last_exc: Exception | None = None
-        for selector in fallbacks:
-            if not selector:
+        # None marks the in-page scan of the switch items.
+        for selector in (configured, None, *fallbacks):
+            if selector == "":
                 continue
             try:
-                element = self._wait_clickable(driver, selector, timeout=6)
-                if not self._direction_label_ok(driver, element, direction):
-                    continue
-                try:
-                    driver.execute_script("arguments[0].scrollIntoView({block:'center', inline:'center'});", element)
-                except Exception:
-                    pass
-
-                try:
-                    element.click()
-                except Exception:
-                    driver.execute_script("arguments[0].click();", element)
+                if selector is None:
+                    element = self._find_direction_item(driver, direction)
+                    if element is None:
+                        continue
+                else:
+                    element = self._wait_clickable(driver, selector, timeout=6)
+                    if not self._direction_label_ok(driver, element, direction):
+                        continue
+                self._click(driver, element)
                 return
             except Exception as exc:
                 last_exc = exc
@@ -800,6 +1638,16 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
             raise last_exc
         raise RuntimeError("No click selector available for direction")
 
+    def _find_direction_item(self, driver, direction: SlideDirection):
+        # One pass over the switch items by class; labels are matched in Python
+        # instead of with translate() inside XPath.
+        items = driver.execute_script(_DIRECTION_ITEMS_JS, _DIRECTION_ITEM_SELECTOR)
+        for element, text in items or []:
+            text = str(text or "").lower()
+            if text and self._direction_text_ok(text, direction):
+                return element
+        return None
+
     def _direction_label_ok(self, driver, element, direction: SlideDirection) -> bool:
         try:
             text = (element.text or "").strip().lower()
@@ -810,102 +1658,130 @@ class PocketOptionSeleniumAdapter(BrokerAdapter):
 
         if not text:
             return True
+        return self._direction_text_ok(text, direction)
 
-        buy_words = ("buy", "call", "higher")
-        sell_words = ("sell", "put", "lower")
-
+    @staticmethod
+    def _direction_text_ok(text: str, direction: SlideDirection) -> bool:
         if direction == SlideDirection.BUY:
-            if any(word in text for word in sell_words):
-                return False
-            return any(word in text for word in buy_words)
-
-        if any(word in text for word in buy_words):
-            return False
-        return any(word in text for word in sell_words)
+            return _RX_SELL_WORDS.search(text) is None and _RX_BUY_WORDS.search(text) is not None
+        return _RX_BUY_WORDS.search(text) is None and _RX_SELL_WORDS.search(text) is not None
 
     def get_market_price(self) -> float | None:
-        if webdriver is None:
+        if not _ensure_selenium():
             return None
 
         try:
             driver = self._ensure_driver()
-            if "pocketoption.com" not in (driver.current_url or ""):
-                return None
+            tick = self._poll_ticker(driver)
+            if tick is not None:
+                return tick[0]
 
-            configured_selector = self.settings.broker_selectors.get("price_value", "").strip()
-            candidates = [
-                configured_selector,
-                ".current-price",
-                ".asset-price",
-                ".value__val",
-                "[data-test='current-asset-price']",
-                "xpath=//*[contains(@class,'value__val')]",
-            ]
+            if "pocketoption.com" not in self._current_url(driver):
+                return None
 
-            for selector in candidates:
-                if not selector:
-                    continue
-                try:
-                    elements = self._find_elements(driver, selector)
-                except Exception:
-                    continue
-                for element in elements:
-                    value = self._parse_float(element.text)
-                    if value is not None and value > 0:
-                        return value
+            for element in self._iter_candidate_elements(driver, self._price_selectors()):
+                value = self._parse_float(element.text)
+                if value is not None and value > 0:
+                    return value
             return None
         except Exception:
             return None
 
     def get_account_balance(self) -> float | None:
-        if webdriver is None:
+        if not _ensure_selenium():
             return None
 
         try:
             driver = self._ensure_driver()
-            if "pocketoption.com" not in (driver.current_url or ""):
+            tick = self._poll_ticker(driver)
+            if tick is not None:
+                return tick[1]
+
+            if "pocketoption.com" not in self._current_url(driver):
                 return None
 
-            selectors = [
-                self.settings.broker_selectors.get("balance_value", "").strip(),
-                ".js-balance-demo",
-                ".js-balance-real-NGN",
-                ".js-balance-real-USD",
-                "xpath=//span[contains(@class,'js-balance-demo')]",
-            ]
+            for element in self._iter_candidate_elements(driver, self._balance_selectors()):
+                raw = (element.text or "").strip()
+                value = self._parse_float(raw)
+                if value is None:
+                    attr_value = element.get_attribute("data-hd-show") or ""
+                    value = self._parse_float(attr_value)
+                if value is not None:
+                    return value
 
-            for selector in selectors:
-                if not selector:
-                    continue
-                try:
-                    elements = self._find_elements(driver, selector)
-                except Exception:
-                    continue
+            return None
+        except Exception:
+            return None
 
-                for element in elements:
-                    raw = (element.text or "").strip()
-                    value = self._parse_float(raw)
-                    if value is None:
-                        attr_value = element.get_attribute("data-hd-show") or ""
-                        value = self._parse_float(attr_value)
-                    if value is not None:
-                        return value
+    def _price_selectors(self) -> list[str]:
+        return [self._selectors.get("price_value", ""), *_PRICE_FALLBACKS]
 
-            return None
+    def _balance_selectors(self) -> list[str]:
+        return [self._selectors.get("balance_value", ""), *_BALANCE_FALLBACKS]
+
+    def _iter_candidate_elements(self, driver, selectors: list[str]):
+        # One script call returns every candidate in selector order, so the configured
+        # selector still wins over the generic fallbacks.
+        selectors = [selector for selector in selectors if selector]
+        try:
+            found = driver.execute_script(_CANDIDATE_ELEMENTS_JS, selectors)
+        except Exception:
+            found = None
+        if isinstance(found, list):
+            yield from found
+            return
+        for selector in selectors:
+            try:
+                yield from self._find_elements(driver, selector)
+            except Exception:
+                continue
+
+    def _poll_ticker(self, driver) -> tuple[float | None, float | None] | None:
+        # Price and balance come from one evaluate and are shared for _TICK_TTL,
+        # so polling both costs a single round trip.
+        now = time.monotonic()
+        tick = self._last_tick
+        if tick is not None and now - tick[0] < _TICK_TTL:
+            return tick[1], tick[2]
+
+        expression = f"{_TICKER_JS}({json.dumps(self._price_selectors())}, {json.dumps(self._balance_selectors())})"
+        try:
+            read = self._evaluate(driver, expression)
         except Exception:
             return None
+        if not isinstance(read, dict):
+            return None
+
+        price: float | None = None
+        balance: float | None = None
+        self._remember_url(str(read.get("url") or ""), now)
+        if "pocketoption.com" in self._last_url:
+            if isinstance(read.get("price"), (int, float)):
+                price = float(read["price"])
+            if isinstance(read.get("balance"), (int, float)):
+                balance = float(read["balance"])
+
+        self._last_tick = (now, price, balance)
+        return price, balance
+
+    def _evaluate(self, driver, expression: str):
+        # Value-only reads go through DevTools Runtime.evaluate, which returns plain
+        # JSON without WebDriver's script wrapper or element serialization.
+        execute_cdp_cmd = getattr(driver, "execute_cdp_cmd", None)
+        if execute_cdp_cmd is None:
+            return driver.execute_script(f"return {expression};")
+        response = execute_cdp_cmd("Runtime.evaluate", {"expression": expression, "returnByValue": True})
+        if response.get("exceptionDetails"):
+            raise RuntimeError(str(response["exceptionDetails"].get("text") or "Runtime.evaluate failed"))
+        return (response.get("result") or {}).get("value")
 
     @staticmethod
     def _parse_float(text: str) -> float | None:
         if not text:
             return None
-        cleaned = text.strip().replace(" ", "")
-        cleaned = re.sub(r"[^0-9,.-]", "", cleaned)
-
-        if cleaned.count(",") > 0 and cleaned.count(".") > 0:
-            cleaned = cleaned.replace(",", "")
-        elif cleaned.count(",") > 0 and cleaned.count(".") == 0:
-            cleaned = cleaned.replace(",", ".")
+        cleaned = _RX_NON_NUMERIC.sub("", text)
+        if "," in cleaned:
+            cleaned = cleaned.replace(",", "" if "." in cleaned else ".")
 
         try:
             return float(cleaned)
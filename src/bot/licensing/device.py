@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import hashlib
 import os
 import platform
@@ -17,6 +18,7 @@ def _run_command(command: list[str]) -> str:
         return ""
 
 
+@lru_cache(maxsize=1)
 def _windows_machine_guid() -> str:
     if platform.system().lower() != "windows":
         return ""
@@ -42,10 +44,26 @@ def _first_non_header_line(text: str) -> str:
     return ""
 
 
+def _windows_registry_model() -> str:
+    try:
+        import winreg
+
+        with winreg.OpenKey(winreg.HKEY_LOCAL_MACHINE, r"HARDWARE\DESCRIPTION\System\BIOS") as key:
+            value, _ = winreg.QueryValueEx(key, "SystemProductName")
+            return str(value).strip()
+    except Exception:
+        return ""
+
+
+@lru_cache(maxsize=1)
 def _windows_device_model() -> str:
     if platform.system().lower() != "windows":
         return ""
 
+    model = _windows_registry_model()
+    if model:
+        return model
+
     model_raw = _run_command(["wmic", "computersystem", "get", "model"])
     model = _first_non_header_line(model_raw)
     if model:
@@ -73,18 +91,20 @@ def get_device_model() -> str:
     return f"{system} | {machine} | {node}"
 
 
+@lru_cache(maxsize=1)
 def get_device_fingerprint() -> str:
     machine_guid = ""
     if os.getenv("DEVICE_ID_USE_MACHINE_GUID", "false").strip().lower() in {"1", "true", "yes", "on"}:
         machine_guid = _windows_machine_guid()
-    raw = "|".join(
-        [
+    raw = b"|".join(
+        part.encode("utf-8")
+        for part in (
             platform.system(),
             platform.release(),
             platform.machine(),
             platform.node(),
             str(uuid.getnode()),
             machine_guid,
-        ]
+        )
     )
-    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+    return hashlib.sha256(raw).hexdigest()
@@ -9,14 +9,13 @@ from cryptography.hazmat.primitives import serialization
 from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PrivateKey
 
 
-def issue_device_license(
+def issue_device_license_bytes(
     project_root: Path,
     device_id: str,
     customer: str,
     client_id: str | None = None,
     days: int = 30,
-    out_path: Path | None = None,
-) -> tuple[Path, str]:
+) -> tuple[bytes, str]:
     private_key_path = project_root / "licenses" / "private_key.pem"
     if not private_key_path.exists():
         raise FileNotFoundError("Missing licenses/private_key.pem. Run generate_keys.py first")
@@ -43,7 +42,25 @@ def issue_device_license(
         "signature": base64.b64encode(signature).decode("utf-8"),
     }
 
+    return json.dumps(envelope, indent=2).encode("utf-8"), expires_at_iso
+
+
+def issue_device_license(
+    project_root: Path,
+    device_id: str,
+    customer: str,
+    client_id: str | None = None,
+    days: int = 30,
+    out_path: Path | None = None,
+) -> tuple[Path, str]:
+    license_bytes, expires_at_iso = issue_device_license_bytes(
+        project_root=project_root,
+        device_id=device_id,
+        customer=customer,
+        client_id=client_id,
+        days=days,
+    )
     target = out_path or (project_root / "licenses" / "license.json")
     target.parent.mkdir(parents=True, exist_ok=True)
-    target.write_text(json.dumps(envelope, indent=2), encoding="utf-8")
+    target.write_bytes(license_bytes)
     return target, expires_at_iso
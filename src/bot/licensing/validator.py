@@ -16,6 +16,9 @@ except Exception:  # pragma: no cover
     Ed25519PublicKey = None
 
 
+_UTC = timezone.utc
+
+
 @dataclass(slots=True)
 class LicenseValidationResult:
     valid: bool
@@ -29,6 +32,8 @@ class LicenseValidator:
         self.license_path = self.project_root / "licenses" / "license.json"
         self.public_key_path = self.project_root / "licenses" / "public_key.pem"
         self.client_lock_path = self.project_root / "data" / "client_id.lock"
+        self._public_key_cache: tuple[int, object] | None = None
+        self._license_cache: tuple[int, dict, bytes, bytes] | None = None
 
     def current_device_id(self) -> str:
         return get_device_fingerprint()
@@ -37,34 +42,43 @@ class LicenseValidator:
         if serialization is None or Ed25519PublicKey is None:
             return LicenseValidationResult(False, "Missing dependency: install cryptography package")
 
-        if not self.public_key_path.exists():
+        try:
+            public_key_mtime = self.public_key_path.stat().st_mtime_ns
+        except OSError:
             return LicenseValidationResult(False, "Missing public key at licenses/public_key.pem")
 
-        if not self.license_path.exists():
+        try:
+            license_mtime = self.license_path.stat().st_mtime_ns
+        except OSError:
             return LicenseValidationResult(
                 False,
                 "Missing license file at licenses/license.json",
             )
 
-        try:
-            envelope = json.loads(self.license_path.read_text(encoding="utf-8"))
-            payload = envelope["payload"]
-            signature_b64 = envelope["signature"]
-        except Exception as exc:
-            return LicenseValidationResult(False, f"Invalid license file format: {exc}")
+        # The envelope and key are only re-read and re-parsed when their files change.
+        cached_license = self._license_cache
+        if cached_license is not None and cached_license[0] == license_mtime:
+            _, payload, payload_bytes, signature = cached_license
+        else:
+            try:
+                envelope = json.loads(self.license_path.read_text(encoding="utf-8"))
+                payload = envelope["payload"]
+                signature_b64 = envelope["signature"]
+            except Exception as exc:
+                return LicenseValidationResult(False, f"Invalid license file format: {exc}")
 
-        payload_text = json.dumps(payload, sort_keys=True, separators=(",", ":"))
-        try:
-            signature = base64.b64decode(signature_b64)
-        except Exception as exc:
-            return LicenseValidationResult(False, f"Invalid signature encoding: {exc}")
+            payload_bytes = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+            try:
+                signature = base64.b64decode(signature_b64)
+            except Exception as exc:
+                return LicenseValidationResult(False, f"Invalid signature encoding: {exc}")
+            self._license_cache = (license_mtime, payload, payload_bytes, signature)
 
         try:
-            public_key_pem = self.public_key_path.read_bytes()
-            public_key = serialization.load_pem_public_key(public_key_pem)
+            public_key = self._load_public_key(public_key_mtime)
             if not isinstance(public_key, Ed25519PublicKey):
                 return LicenseValidationResult(False, "Public key is not Ed25519")
-            public_key.verify(signature, payload_text.encode("utf-8"))
+            public_key.verify(signature, payload_bytes)
         except Exception as exc:
             return LicenseValidationResult(False, f"Signature verification failed: {exc}")
 
@@ -74,10 +88,10 @@ class LicenseValidator:
 
         expires_at_text = str(payload.get("expires_at", ""))
         try:
-            expires_at = datetime.fromisoformat(expires_at_text.replace("Z", "+00:00"))
-            now = datetime.now(timezone.utc)
+            expires_at = datetime.fromisoformat(expires_at_text)
+            now = datetime.now(_UTC)
             if expires_at.tzinfo is None:
-                expires_at = expires_at.replace(tzinfo=timezone.utc)
+                expires_at = expires_at.replace(tzinfo=_UTC)
             if now > expires_at:
                 return LicenseValidationResult(False, "License has expired", expires_at=expires_at_text)
         except Exception as exc:
@@ -101,3 +115,11 @@ class LicenseValidator:
                 return LicenseValidationResult(False, f"Client ID lock check failed: {exc}")
 
         return LicenseValidationResult(True, "License valid", expires_at=expires_at_text)
+
+    def _load_public_key(self, mtime_ns: int):
+        cached = self._public_key_cache
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        public_key = serialization.load_pem_public_key(self.public_key_path.read_bytes())
+        self._public_key_cache = (mtime_ns, public_key)
+        return public_key
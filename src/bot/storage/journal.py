@@ -1,22 +1,85 @@
 from __future__ import annotations
 
+import atexit
+import logging
+import queue
 import sqlite3
+import threading
+import time
 from pathlib import Path
 
-from bot.core.models import SessionStats, TradeRecord, TradeSignal
+from bot.core.models import SessionStats, TradeRecord, TradeSignal, utc_from_ns
+
+
+_INSERT_SQL = {
+    "trades": """
+        INSERT INTO trades (timestamp, pair_name, direction, stake, expiry, outcome, pnl)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """,
+    "sessions": """
+        INSERT INTO sessions (
+            started_at, stopped_at, start_balance, session_profit,
+            trades_taken, wins, losses, stop_reason
+        )
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    """,
+    "signals": """
+        INSERT INTO signals (timestamp, pair_name, direction, expiry, confidence, reason)
+        VALUES (?, ?, ?, ?, ?, ?)
+    """,
+}
+_NS_TIMESTAMP_TABLES = frozenset({"trades", "signals"})
+_WRITER_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=33554432",
+)
+_WRITE_RETRY_DELAYS = (0.5, 1.0, 2.0, 5.0)
+
+_log = logging.getLogger(__name__)
 
 
 class Journal:
-    def __init__(self, db_path: Path) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        batch_size: int = 64,
+        commit_delay: float = 0.1,
+        max_pending: int = 10000,
+        enqueue_timeout: float = 0.5,
+    ) -> None:
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self._init_db()
+        self.batch_size = max(1, int(batch_size))
+        self.commit_delay = max(0.0, float(commit_delay))
+        self.enqueue_timeout = max(0.0, float(enqueue_timeout))
+        # Bounded so a stalled writer cannot grow memory without limit: producers block for
+        # up to enqueue_timeout, then the row is dropped and logged.
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, int(max_pending)))
+        self._closing = threading.Event()
+        self._last_write_error: Exception | None = None
+        self._read_lock = threading.Lock()
+        self._read_conn: sqlite3.Connection | None = None
+        self._writer_thread = threading.Thread(target=self._writer_loop, name="journal-writer", daemon=True)
+        self._writer_thread.start()
+        atexit.register(self.close)
+
+    def _reader(self) -> sqlite3.Connection:
+        if self._read_conn is None:
+            self._read_conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._read_conn.row_factory = sqlite3.Row
+        return self._read_conn
 
-    def _connect(self) -> sqlite3.Connection:
-        return sqlite3.connect(self.db_path)
+    def _open_writer_connection(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        for pragma in _WRITER_PRAGMAS:
+            conn.execute(pragma)
+        self._init_db(conn)
+        return conn
 
-    def _init_db(self) -> None:
-        with self._connect() as conn:
+    def _init_db(self, conn: sqlite3.Connection) -> None:
+        with conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -59,16 +122,28 @@ class Journal:
                 )
                 """
             )
-
-    def log_trade(self, trade: TradeRecord) -> None:
-        with self._connect() as conn:
             conn.execute(
                 """
-                INSERT INTO trades (timestamp, pair_name, direction, stake, expiry, outcome, pnl)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
+                CREATE INDEX IF NOT EXISTS idx_signals_execution_attempts
+                ON signals(id) WHERE reason LIKE 'execution-attempt%'
+                """
+            )
+
+    def _enqueue(self, item: tuple) -> None:
+        if self._closing.is_set():
+            _log.error("Journal is closed; dropped %s row", item[0])
+            return
+        try:
+            self._queue.put(item, timeout=self.enqueue_timeout)
+        except queue.Full:
+            _log.error("Journal queue full (%d pending); dropped %s row", self._queue.maxsize, item[0])
+
+    def log_trade(self, trade: TradeRecord) -> None:
+        self._enqueue(
+            (
+                "trades",
                 (
-                    trade.timestamp.isoformat(),
+                    trade.timestamp_ns,
                     trade.pair,
                     trade.direction.value,
                     trade.stake,
@@ -77,17 +152,12 @@ class Journal:
                     trade.pnl,
                 ),
             )
+        )
 
     def log_session(self, stats: SessionStats) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO sessions (
-                    started_at, stopped_at, start_balance, session_profit,
-                    trades_taken, wins, losses, stop_reason
-                )
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+        self._enqueue(
+            (
+                "sessions",
                 (
                     stats.started_at.isoformat() if stats.started_at else None,
                     stats.stopped_at.isoformat() if stats.stopped_at else None,
@@ -99,16 +169,14 @@ class Journal:
                     stats.stop_reason.value if stats.stop_reason else None,
                 ),
             )
+        )
 
     def log_signal(self, signal: TradeSignal) -> None:
-        with self._connect() as conn:
-            conn.execute(
-                """
-                INSERT INTO signals (timestamp, pair_name, direction, expiry, confidence, reason)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
+        self._enqueue(
+            (
+                "signals",
                 (
-                    signal.timestamp.isoformat(),
+                    signal.timestamp_ns,
                     signal.pair,
                     signal.direction.value,
                     signal.expiry,
@@ -116,13 +184,125 @@ class Journal:
                     signal.reason,
                 ),
             )
+        )
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        if not self._writer_thread.is_alive():
+            return False
+        done = threading.Event()
+        try:
+            self._queue.put(("flush", done), timeout=timeout)
+        except queue.Full:
+            return False
+        return done.wait(timeout) and self._last_write_error is None
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._closing.set()
+        deadline = time.monotonic() + timeout
+        while self._writer_thread.is_alive() and time.monotonic() < deadline:
+            try:
+                self._queue.put(("close", None), timeout=0.1)
+            except queue.Full:
+                continue
+            break
+        self._writer_thread.join(max(0.0, deadline - time.monotonic()))
+        with self._read_lock:
+            if self._read_conn is not None:
+                self._read_conn.close()
+                self._read_conn = None
+
+    def _writer_loop(self) -> None:
+        # The database is only opened (and its schema created) once there is a row to write.
+        conn: sqlite3.Connection | None = None
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.commit_delay
+            while len(batch) < self.batch_size and batch[-1][0] not in ("flush", "close"):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            conn = self._write_batch(conn, batch)
+            if batch[-1][0] == "close" or (self._closing.is_set() and self._last_write_error is not None):
+                if self._last_write_error is not None and not self._queue.empty():
+                    _log.error("Journal writer stopped with %d queued item(s) unwritten", self._queue.qsize())
+                if conn is not None:
+                    conn.close()
+                return
+
+    def _write_batch(self, conn: sqlite3.Connection | None, batch: list[tuple]) -> sqlite3.Connection | None:
+        rows_by_table: dict[str, list[tuple]] = {}
+        waiters: list[threading.Event] = []
+        for table, payload in batch:
+            if table == "flush":
+                waiters.append(payload)
+                continue
+            if table == "close":
+                continue
+            if table in _NS_TIMESTAMP_TABLES:
+                payload = (utc_from_ns(payload[0]).isoformat(), *payload[1:])
+            rows_by_table.setdefault(table, []).append(payload)
+
+        # A failed open or commit keeps the batch and retries it; the writer stops draining the
+        # queue meanwhile, so producers see the bounded queue fill up instead of losing rows here.
+        attempt = 0
+        while rows_by_table:
+            try:
+                if conn is None:
+                    conn = self._open_writer_connection()
+                conn.execute("BEGIN IMMEDIATE")
+                for table, rows in rows_by_table.items():
+                    conn.executemany(_INSERT_SQL[table], rows)
+                conn.execute("COMMIT")
+            except (sqlite3.Error, OSError) as exc:
+                if conn is not None:
+                    self._discard_writer_connection(conn)
+                    conn = None
+                self._last_write_error = exc
+                row_count = sum(len(rows) for rows in rows_by_table.values())
+                if self._closing.is_set():
+                    _log.error("Journal write failed during shutdown; dropped %d row(s): %s", row_count, exc)
+                    break
+                delay = _WRITE_RETRY_DELAYS[min(attempt, len(_WRITE_RETRY_DELAYS) - 1)]
+                attempt += 1
+                _log.warning("Journal write of %d row(s) failed, retrying in %.1fs: %s", row_count, delay, exc)
+                self._closing.wait(delay)
+            else:
+                if self._last_write_error is not None:
+                    _log.info("Journal writes recovered")
+                self._last_write_error = None
+                break
+
+        for waiter in waiters:
+            waiter.set()
+        return conn
+
+    @staticmethod
+    def _discard_writer_connection(conn: sqlite3.Connection) -> None:
+        try:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            conn.close()
+        except sqlite3.Error:
+            pass
 
     def recent_execution_attempts(self, limit: int = 10) -> list[dict[str, str]]:
         safe_limit = max(1, min(int(limit), 100))
-        with self._connect() as conn:
-            rows = conn.execute(
+        self.flush()
+        if not self.db_path.exists():
+            return []
+        with self._read_lock:
+            rows = self._reader().execute(
                 """
-                SELECT timestamp, pair_name, direction, expiry, reason
+                SELECT
+                    COALESCE(timestamp, '') AS timestamp,
+                    COALESCE(pair_name, '') AS pair,
+                    COALESCE(direction, '') AS direction,
+                    COALESCE(expiry, '') AS expiry,
+                    COALESCE(reason, '') AS reason
                 FROM signals
                 WHERE reason LIKE 'execution-attempt%'
                 ORDER BY id DESC
@@ -130,16 +310,4 @@ class Journal:
                 """,
                 (safe_limit,),
             ).fetchall()
-
-        result: list[dict[str, str]] = []
-        for timestamp, pair_name, direction, expiry, reason in rows:
-            result.append(
-                {
-                    "timestamp": str(timestamp or ""),
-                    "pair": str(pair_name or ""),
-                    "direction": str(direction or ""),
-                    "expiry": str(expiry or ""),
-                    "reason": str(reason or ""),
-                }
-            )
-        return result
+        return [dict(row) for row in rows]
@@ -1,19 +1,44 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
 import threading
-import time
 from pathlib import Path
 import tkinter as tk
+import urllib.error
+import urllib.parse
 import urllib.request
 from tkinter import font, messagebox
+from typing import Callable
 
 from bot.core.controller import BotController
 from bot.core.models import BotMode, BotSettings, ExecutionMode, SlideDirection
 
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
+
+
+# Waits before each broker open attempt; the first attempt runs immediately.
+_BROKER_OPEN_RETRY_DELAYS = (0.0, 0.2, 0.5)
+
+# Announcement redirects that are remembered for later polls; 302/303/307 are followed once per poll.
+_PERMANENT_REDIRECTS = (301, 308)
+_REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
 
 class BotApp:
+    # Fonts are never reconfigured, so one instance per (root, spec) is shared.
+    _fonts_cache: dict[tuple, font.Font] = {}
+
     def __init__(self, root: tk.Tk, project_root: Path, controller: BotController | None = None) -> None:
         self.root = root
         self.controller = controller or BotController(project_root)
@@ -34,6 +59,30 @@ class BotApp:
         self.color_link = "#72b7ff"
 
         self.root.configure(bg=self.color_bg)
+        self._entry_kw = {
+            "bg": self.color_input,
+            "fg": self.color_text,
+            "insertbackground": self.color_text,
+            "relief": "solid",
+            "bd": 1,
+            "highlightthickness": 0,
+            "justify": "center",
+        }
+        self._menu_kw = {
+            "bg": self.color_input,
+            "fg": self.color_text,
+            "activebackground": self.color_panel,
+            "activeforeground": self.color_text,
+            "highlightthickness": 0,
+            "bd": 1,
+            "relief": "solid",
+        }
+        self._menu_dropdown_kw = {
+            "bg": self.color_input,
+            "fg": self.color_text,
+            "activebackground": self.color_panel,
+            "activeforeground": self.color_text,
+        }
 
         self.trade_capital_var = tk.StringVar(value=str(self.controller.settings.trade_capital))
         self.target_profit_var = tk.StringVar(value=str(self.controller.settings.target_profit))
@@ -47,24 +96,39 @@ class BotApp:
         self.mart_action_var = tk.StringVar(value="STOP")
 
         self.status_var = tk.StringVar(value="Ready")
+        self._last_status = "Ready"
         self.pin_window_var = tk.BooleanVar(value=True)
         self._attempts_window: tk.Toplevel | None = None
         self._attempts_text: tk.Text | None = None
         self._attempts_refresh_job: str | None = None
+        self._attempts_last_version = -1
+        self._refreshing_attempts = False
+        self._last_settings_key: tuple | None = None
+        self._last_saved_settings: BotSettings | None = None
+        self._announcement_state_path = self.controller.project_root / "data" / "announcement_seen.txt"
+        self._local_announcement_path = self.controller.project_root / "licenses" / "app_announcements.json"
         self._announcement_last_seen_id = self._load_last_seen_announcement_id()
-
+        self._announcement_file_cache: tuple[int, int, dict | None] | None = None
+        self._announcement_url_cache: tuple[str, str, str, dict] | None = None
+        self._announcement_target: tuple[str, str, str, str, int | None, str] | None = None
+        self._announcement_conn: http.client.HTTPConnection | None = None
+        self._announcement_fetching = threading.Event()
+        self._shutdown_event = threading.Event()
+
+        # Build the widget tree while hidden so geometry is computed once, on first show.
+        self.root.withdraw()
         self._build_ui()
+        self.root.deiconify()
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
         self.mode_var.trace_add("write", lambda *_: self._render_primary_action_buttons())
+        self.controller.on_state_change.append(lambda _state, _message: self.root.after(0, self._apply_state))
         self._schedule_status_refresh()
         self._schedule_announcement_refresh()
         self.root.after(500, self._open_pocket_option_on_launch)
 
-    def _announcement_state_path(self) -> Path:
-        return self.controller.project_root / "data" / "announcement_seen.txt"
-
     def _load_last_seen_announcement_id(self) -> str:
         try:
-            path = self._announcement_state_path()
+            path = self._announcement_state_path
             if not path.exists():
                 return ""
             return path.read_text(encoding="utf-8").strip()
@@ -73,7 +137,7 @@ class BotApp:
 
     def _save_last_seen_announcement_id(self, announcement_id: str) -> None:
         try:
-            path = self._announcement_state_path()
+            path = self._announcement_state_path
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text(announcement_id.strip(), encoding="utf-8")
         except Exception:
@@ -82,41 +146,183 @@ class BotApp:
     def _load_announcement(self) -> dict | None:
         url = os.getenv("APP_ANNOUNCEMENT_URL", "").strip()
         if url:
-            try:
-                with urllib.request.urlopen(url, timeout=4) as response:
-                    payload = response.read().decode("utf-8")
-                data = json.loads(payload)
-                if isinstance(data, dict):
-                    return data
-            except Exception:
+            return self._fetch_announcement(url)
+
+        local_path = self._local_announcement_path
+        try:
+            stat = local_path.stat()
+        except OSError:
+            return None
+        cached = self._announcement_file_cache
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
+
+        data = None
+        try:
+            loaded = _loads(local_path.read_bytes())
+            if isinstance(loaded, dict):
+                data = loaded
+        except Exception:
+            return None
+        self._announcement_file_cache = (stat.st_mtime_ns, stat.st_size, data)
+        return data
+
+    def _announcement_connection(self, url: str) -> tuple[http.client.HTTPConnection, str] | None:
+        # One keep-alive connection is reused across polls while the URL keeps the same origin.
+        target = self._announcement_target
+        if target is None or target[0] != url:
+            target = self._retarget_announcement(url, url)
+            if target is None:
                 return None
+        if self._announcement_conn is None:
+            _, _, scheme, host, port, _ = target
+            connection_cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+            self._announcement_conn = connection_cls(host, port, timeout=4)
+        return self._announcement_conn, target[5]
+
+    def _retarget_announcement(self, url: str, location: str) -> tuple[str, str, str, str, int | None, str] | None:
+        parts = urllib.parse.urlsplit(location)
+        if parts.scheme not in ("http", "https") or not parts.hostname:
+            return None
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+        target = (url, location, parts.scheme, parts.hostname, parts.port, path)
+        self._announcement_target = target
+        self._close_announcement_connection()
+        return target
+
+    def _close_announcement_connection(self) -> None:
+        if self._announcement_conn is not None:
+            self._announcement_conn.close()
+            self._announcement_conn = None
+
+    def _fetch_announcement(self, url: str) -> dict | None:
+        cached = self._announcement_url_cache
+        if cached is None or cached[0] != url:
+            cached = None
+        headers = {}
+        if cached is not None:
+            if cached[1]:
+                headers["If-None-Match"] = cached[1]
+            if cached[2]:
+                headers["If-Modified-Since"] = cached[2]
+
+        if self._announcement_proxied(url):
+            fetched = self._fetch_announcement_via_urllib(url, headers)
+        else:
+            fetched = self._fetch_announcement_direct(url, headers)
+        if fetched is None:
+            return None
+        status, etag, last_modified, payload = fetched
 
-        local_path = self.controller.project_root / "licenses" / "app_announcements.json"
-        if not local_path.exists():
+        if status == 304:
+            return cached[3] if cached is not None else None
+        if status != 200:
             return None
         try:
-            data = json.loads(local_path.read_text(encoding="utf-8"))
-            if isinstance(data, dict):
-                return data
+            data = _loads(payload)
         except Exception:
             return None
+        if not isinstance(data, dict):
+            return None
+        self._announcement_url_cache = (url, etag, last_modified, data)
+        return data
+
+    @staticmethod
+    def _announcement_proxied(url: str) -> bool:
+        # The keep-alive connection talks to the origin directly, so proxied URLs go through urllib.
+        parts = urllib.parse.urlsplit(url)
+        proxies = urllib.request.getproxies()
+        if not proxies.get(parts.scheme):
+            return False
+        return not urllib.request.proxy_bypass(parts.hostname or "")
+
+    def _fetch_announcement_via_urllib(self, url: str, headers: dict) -> tuple[int, str, str, bytes] | None:
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with urllib.request.urlopen(request, timeout=4) as response:
+                return response.status, response.headers.get("ETag", ""), response.headers.get("Last-Modified", ""), response.read()
+        except urllib.error.HTTPError as exc:
+            return exc.code, "", "", b""
+        except (urllib.error.URLError, http.client.HTTPException, OSError):
+            return None
+
+    def _fetch_announcement_direct(self, url: str, headers: dict) -> tuple[int, str, str, bytes] | None:
+        temporary_redirect = False
+        # The URL itself, then at most one redirect.
+        for _ in range(2):
+            fetched = self._request_announcement(url, headers)
+            if fetched is None:
+                return None
+            response, payload = fetched
+            if response.status not in _REDIRECT_STATUSES:
+                break
+            location = response.getheader("Location", "")
+            base = self._announcement_target[1] if self._announcement_target is not None else url
+            if not location or self._retarget_announcement(url, urllib.parse.urljoin(base, location)) is None:
+                return None
+            temporary_redirect = temporary_redirect or response.status not in _PERMANENT_REDIRECTS
+        else:
+            self._announcement_target = None
+            self._close_announcement_connection()
+            return None
+
+        if temporary_redirect:
+            # Ask the configured URL again next poll instead of pinning a temporary location.
+            self._announcement_target = None
+            self._close_announcement_connection()
+        return response.status, response.getheader("ETag", ""), response.getheader("Last-Modified", ""), payload
+
+    def _request_announcement(self, url: str, headers: dict) -> tuple[http.client.HTTPResponse, bytes] | None:
+        # A reused connection may have been dropped by the server while idle, so a
+        # failure on it gets one retry on a fresh connection.
+        for _ in range(2):
+            reused = self._announcement_conn is not None
+            try:
+                target = self._announcement_connection(url)
+                if target is None:
+                    return None
+                conn, path = target
+                conn.request("GET", path, headers=headers)
+                response = conn.getresponse()
+                return response, response.read()
+            except (http.client.HTTPException, OSError):
+                self._close_announcement_connection()
+                if not reused:
+                    return None
         return None
 
     def _schedule_announcement_refresh(self) -> None:
+        # The fetch can block on the network, so it runs off the Tk thread; a poll
+        # is skipped while the previous one is still in flight or the window is minimized/hidden.
+        if self.root.state() not in ("iconic", "withdrawn") and not self._announcement_fetching.is_set():
+            self._announcement_fetching.set()
+
+            def _worker() -> None:
+                try:
+                    announcement = self._load_announcement()
+                except Exception:
+                    announcement = None
+                finally:
+                    self._announcement_fetching.clear()
+                if announcement:
+                    self.root.after(0, lambda data=announcement: self._apply_announcement(data))
+
+            threading.Thread(target=_worker, daemon=True).start()
+        self.root.after(15000, self._schedule_announcement_refresh)
+
+    def _apply_announcement(self, announcement: dict) -> None:
         try:
-            announcement = self._load_announcement()
-            if announcement:
-                announcement_id = str(announcement.get("id", "")).strip()
-                message = str(announcement.get("message", "")).strip()
-                title = str(announcement.get("title", "Update")).strip() or "Update"
-                if announcement_id and message and announcement_id != self._announcement_last_seen_id:
-                    self._announcement_last_seen_id = announcement_id
-                    self._save_last_seen_announcement_id(announcement_id)
-                    messagebox.showinfo(f"{title}", message)
+            announcement_id = str(announcement.get("id", "")).strip()
+            message = str(announcement.get("message", "")).strip()
+            title = str(announcement.get("title", "Update")).strip() or "Update"
+            if announcement_id and message and announcement_id != self._announcement_last_seen_id:
+                self._announcement_last_seen_id = announcement_id
+                self._save_last_seen_announcement_id(announcement_id)
+                messagebox.showinfo(f"{title}", message)
         except Exception:
             pass
-        finally:
-            self.root.after(15000, self._schedule_announcement_refresh)
 
     def _build_ui(self) -> None:
         container = tk.Frame(self.root, bg=self.color_bg)
@@ -129,9 +335,17 @@ class BotApp:
         self._build_action_buttons(container)
         self._build_bottom_link(container)
 
+    def _get_font(self, family: str, size: int, weight: str = "normal", underline: bool = False) -> font.Font:
+        key = (self.root, family, size, weight, underline)
+        cached = self._fonts_cache.get(key)
+        if cached is None:
+            cached = font.Font(root=self.root, family=family, size=size, weight=weight, underline=underline)
+            self._fonts_cache[key] = cached
+        return cached
+
     def _build_branding(self, parent: tk.Frame) -> None:
-        skull_font = font.Font(family="Segoe UI Symbol", size=28, weight="bold")
-        title_font = font.Font(family="Segoe UI", size=16, weight="bold")
+        skull_font = self._get_font("Segoe UI Symbol", 28, weight="bold")
+        title_font = self._get_font("Segoe UI", 16, weight="bold")
 
         tk.Label(parent, text="☠", fg=self.color_text, bg=self.color_bg, font=skull_font).pack(pady=(2, 0))
         tk.Label(parent, text="Austin Maxi Bot", fg=self.color_text, bg=self.color_bg, font=title_font).pack(pady=(2, 4))
@@ -177,32 +391,12 @@ class BotApp:
         return panel
 
     def _styled_entry(self, parent: tk.Frame, variable: tk.StringVar, width: int = 10) -> tk.Entry:
-        return tk.Entry(
-            parent,
-            textvariable=variable,
-            width=width,
-            bg=self.color_input,
-            fg=self.color_text,
-            insertbackground=self.color_text,
-            relief="solid",
-            bd=1,
-            highlightthickness=0,
-            justify="center",
-        )
+        return tk.Entry(parent, textvariable=variable, width=width, **self._entry_kw)
 
     def _styled_menu(self, parent: tk.Frame, variable: tk.StringVar, values: list[str], width: int = 8) -> tk.OptionMenu:
         menu = tk.OptionMenu(parent, variable, *values)
-        menu.config(
-            width=width,
-            bg=self.color_input,
-            fg=self.color_text,
-            activebackground=self.color_panel,
-            activeforeground=self.color_text,
-            highlightthickness=0,
-            bd=1,
-            relief="solid",
-        )
-        menu["menu"].config(bg=self.color_input, fg=self.color_text, activebackground=self.color_panel, activeforeground=self.color_text)
+        menu.config(width=width, **self._menu_kw)
+        menu["menu"].config(**self._menu_dropdown_kw)
         return menu
 
     def _build_main_settings_panel(self, parent: tk.Frame) -> None:
@@ -271,9 +465,12 @@ class BotApp:
         ).grid(row=1, column=2, columnspan=2, padx=(8, 10), pady=(4, 8), sticky="w")
 
     def _build_action_buttons(self, parent: tk.Frame) -> None:
-        self.primary_btn_font = font.Font(family="Segoe UI", size=11, weight="bold")
+        self.primary_btn_font = self._get_font("Segoe UI", 11, weight="bold")
         self.primary_action_frame = tk.Frame(parent, bg=self.color_bg)
         self.primary_action_frame.pack(fill="x", pady=(4, 8))
+        self._btn_start = self._primary_action_button("Start", self._start, self.color_start)
+        self._btn_call = self._primary_action_button("Call", self._start_call, self.color_start)
+        self._btn_put = self._primary_action_button("Put", self._start_put, self.color_put)
         self._render_primary_action_buttons()
 
         row = tk.Frame(parent, bg=self.color_bg)
@@ -325,6 +522,22 @@ class BotApp:
             bd=0,
         ).pack(anchor="w", pady=(6, 0))
 
+    def _primary_action_button(self, text: str, command: Callable[[], None], color: str) -> tk.Button:
+        return tk.Button(
+            self.primary_action_frame,
+            text=text,
+            command=command,
+            bg=color,
+            fg=self.color_text,
+            activebackground=color,
+            activeforeground=self.color_text,
+            relief="flat",
+            bd=0,
+            height=2,
+            font=self.primary_btn_font,
+            cursor="hand2",
+        )
+
     def _build_bottom_link(self, parent: tk.Frame) -> None:
         tools_row = tk.Frame(parent, bg=self.color_bg)
         tools_row.pack(side="bottom", pady=(8, 0))
@@ -359,7 +572,7 @@ class BotApp:
             pady=3,
         ).pack(pady=(6, 0))
 
-        link_font = font.Font(family="Segoe UI", size=9, underline=True)
+        link_font = self._get_font("Segoe UI", 9, underline=True)
         link = tk.Label(
             parent,
             text="See Usage Tips",
@@ -372,56 +585,30 @@ class BotApp:
         link.bind("<Button-1>", lambda _: self._show_usage_tips())
 
     def _render_primary_action_buttons(self) -> None:
-        for widget in self.primary_action_frame.winfo_children():
-            widget.destroy()
+        for button in (self._btn_start, self._btn_call, self._btn_put):
+            button.pack_forget()
 
         if self.mode_var.get() == BotMode.SLIDE.value:
-            tk.Button(
-                self.primary_action_frame,
-                text="Call",
-                command=self._start_call,
-                bg=self.color_start,
-                fg=self.color_text,
-                activebackground=self.color_start,
-                activeforeground=self.color_text,
-                relief="flat",
-                bd=0,
-                height=2,
-                font=self.primary_btn_font,
-                cursor="hand2",
-            ).pack(side="left", fill="x", expand=True, padx=(0, 5))
-
-            tk.Button(
-                self.primary_action_frame,
-                text="Put",
-                command=self._start_put,
-                bg=self.color_put,
-                fg=self.color_text,
-                activebackground=self.color_put,
-                activeforeground=self.color_text,
-                relief="flat",
-                bd=0,
-                height=2,
-                font=self.primary_btn_font,
-                cursor="hand2",
-            ).pack(side="left", fill="x", expand=True, padx=(5, 0))
+            self._btn_call.pack(side="left", fill="x", expand=True, padx=(0, 5))
+            self._btn_put.pack(side="left", fill="x", expand=True, padx=(5, 0))
         else:
-            tk.Button(
-                self.primary_action_frame,
-                text="Start",
-                command=self._start,
-                bg=self.color_start,
-                fg=self.color_text,
-                activebackground=self.color_start,
-                activeforeground=self.color_text,
-                relief="flat",
-                bd=0,
-                height=2,
-                font=self.primary_btn_font,
-                cursor="hand2",
-            ).pack(fill="x")
+            self._btn_start.pack(fill="x")
 
     def _save_settings(self) -> None:
+        key = (
+            self.trade_capital_var.get(),
+            self.target_profit_var.get(),
+            self.trade_amount_var.get(),
+            self.stack_method_var.get(),
+            self.time_period_var.get(),
+            self.mart_limit_var.get(),
+            self.disable_mart_var.get(),
+            self.mode_var.get(),
+            self.slide_direction_var.get(),
+        )
+        # Nothing to rebuild when the form is unchanged and the controller still holds what was saved.
+        if key == self._last_settings_key and self.controller.settings is self._last_saved_settings:
+            return
         try:
             settings = BotSettings(
                 trade_capital=float(self.trade_capital_var.get()),
@@ -444,19 +631,23 @@ class BotApp:
                 broker_dry_run=self.controller.settings.broker_dry_run,
                 auto_open_broker_on_start=self.controller.settings.auto_open_broker_on_start,
                 auto_execute_signals=self.controller.settings.auto_execute_signals,
+                keep_browser_open=self.controller.settings.keep_browser_open,
+                min_signal_log_interval_s=self.controller.settings.min_signal_log_interval_s,
                 pocket_option_url=self.controller.settings.pocket_option_url,
                 broker_selectors=self.controller.settings.broker_selectors,
             )
             settings.validate()
             self.controller.update_settings(settings)
-            self.status_var.set("Settings updated")
+            self._last_settings_key = key
+            self._last_saved_settings = settings
+            self._set_status("Settings updated")
         except Exception as exc:
-            self.status_var.set(f"Settings error: {exc}")
+            self._set_status(f"Settings error: {exc}")
 
     def _start(self) -> None:
         self._save_settings()
         result = self.controller.start()
-        self.status_var.set(result)
+        self._set_status(result)
 
     def _open_pocket_option_on_launch(self) -> None:
         if self.controller.settings.execution_mode != ExecutionMode.BROKER_PLUGIN:
@@ -464,22 +655,28 @@ class BotApp:
 
         def _worker() -> None:
             last_message = ""
-            for _ in range(3):
+            for delay in _BROKER_OPEN_RETRY_DELAYS:
+                if delay and self._shutdown_event.wait(delay):
+                    return
                 try:
                     message = self.controller.open_broker_session()
                     last_message = message or ""
                     if message and not message.lower().startswith("failed") and "not installed" not in message.lower():
-                        self.root.after(0, lambda msg=message: self.status_var.set(msg))
+                        self.root.after(0, lambda msg=message: self._set_status(msg))
                         return
                 except Exception as exc:
                     last_message = f"Failed to open Pocket Option: {exc}"
-                time.sleep(1.0)
 
-            if last_message:
-                self.root.after(0, lambda msg=last_message: self.status_var.set(msg))
+            if last_message and not self._shutdown_event.is_set():
+                self.root.after(0, lambda msg=last_message: self._set_status(msg))
 
         threading.Thread(target=_worker, daemon=True).start()
 
+    def _on_close(self) -> None:
+        self._shutdown_event.set()
+        self.root.destroy()
+        self.controller.shutdown()
+
     def _start_call(self) -> None:
         self.slide_direction_var.set(SlideDirection.BUY.value)
         self._start()
@@ -489,10 +686,10 @@ class BotApp:
         self._start()
 
     def _pause(self) -> None:
-        self.status_var.set(self.controller.pause())
+        self._set_status(self.controller.pause())
 
     def _stop(self) -> None:
-        self.status_var.set(self.controller.stop())
+        self._set_status(self.controller.stop())
 
     def _show_usage_tips(self) -> None:
         messagebox.showinfo(
@@ -530,6 +727,7 @@ class BotApp:
 
         self._attempts_window = window
         self._attempts_text = text
+        self._attempts_last_version = -1
         self._attempts_window.protocol("WM_DELETE_WINDOW", self._close_last_attempts_window)
         self._refresh_last_attempts_view()
 
@@ -548,58 +746,90 @@ class BotApp:
         self._attempts_text = None
 
     def _refresh_last_attempts_view(self) -> None:
-        if self._attempts_window is None or not self._attempts_window.winfo_exists() or self._attempts_text is None:
+        if self._attempts_refresh_job is not None:
+            # Re-entry from _show_last_attempts must not start a second timer chain.
+            self.root.after_cancel(self._attempts_refresh_job)
             self._attempts_refresh_job = None
+        if self._attempts_window is None or not self._attempts_window.winfo_exists() or self._attempts_text is None:
             return
 
-        content = "No execution attempts logged yet."
-        try:
-            attempts = self.controller.recent_execution_attempts(limit=10)
-            if attempts:
-                content = "\n".join(attempts)
-        except Exception as exc:
-            content = f"Failed to load attempts: {exc}"
+        self._attempts_refresh_job = self.root.after(2000, self._refresh_last_attempts_view)
+        # Only re-read when an attempt was logged since the last render, and never while a read
+        # is still in flight; the journal read can block on a flush, so it runs off the Tk thread.
+        version = self.controller.attempts_version
+        if version == self._attempts_last_version or self._refreshing_attempts:
+            return
+        self._refreshing_attempts = True
+
+        def _worker() -> None:
+            loaded = False
+            content = "No execution attempts logged yet."
+            try:
+                attempts = self.controller.recent_execution_attempts(limit=10)
+                if attempts:
+                    content = "\n".join(attempts)
+                loaded = True
+            except Exception as exc:
+                content = f"Failed to load attempts: {exc}"
+            if not self._shutdown_event.is_set():
+                self.root.after(0, lambda: self._apply_last_attempts(version if loaded else -1, content))
+
+        threading.Thread(target=_worker, daemon=True).start()
 
+    def _apply_last_attempts(self, version: int, content: str) -> None:
+        self._refreshing_attempts = False
+        if self._attempts_window is None or not self._attempts_window.winfo_exists() or self._attempts_text is None:
+            return
+        self._attempts_last_version = version
         self._attempts_text.configure(state="normal")
         self._attempts_text.delete("1.0", tk.END)
         self._attempts_text.insert("1.0", content)
         self._attempts_text.configure(state="disabled")
 
-        self._attempts_refresh_job = self.root.after(2000, self._refresh_last_attempts_view)
-
     def _copy_device_id(self) -> None:
         try:
             device_id = self.controller.device_id()
             self.root.clipboard_clear()
             self.root.clipboard_append(device_id)
-            self.root.update_idletasks()
-            self.status_var.set("Device ID copied")
+            # update_idletasks() does not hand the selection to the OS clipboard on Windows.
+            self.root.update()
+            self._set_status("Device ID copied")
         except Exception as exc:
-            self.status_var.set(f"Copy failed: {exc}")
+            self._set_status(f"Copy failed: {exc}")
 
     def _toggle_topmost(self) -> None:
         self.root.attributes("-topmost", self.pin_window_var.get())
 
     def _schedule_status_refresh(self) -> None:
+        # Changes are pushed through controller.on_state_change; this slow poll
+        # only catches anything that slipped past a notification.
+        self._apply_state()
+        self.root.after(5000, self._schedule_status_refresh)
+
+    def _set_status(self, message: str) -> None:
+        if message == self._last_status:
+            return
+        self._last_status = message
+        self.status_var.set(message)
+
+    def _apply_state(self) -> None:
         try:
             state = self.controller.session.stats.state.value
             if state == "running":
                 message = self.controller.last_execution_message or "Session running"
-                self.status_var.set(message)
+                self._set_status(message)
             elif state == "paused":
-                self.status_var.set("Session paused")
+                self._set_status("Session paused")
             elif state == "stopped":
                 if self.controller.session.stats.stop_reason is not None:
                     reason = self.controller.session.stats.stop_reason.value
                     if reason == "target_profit_reached":
-                        self.status_var.set(
+                        self._set_status(
                             f"🎉 Congratulations! Take profit reached ({self.controller.session.stats.session_profit})."
                         )
                     else:
-                        self.status_var.set(f"Session stopped: {reason}")
-                elif self.status_var.get().strip() == "":
-                    self.status_var.set("Ready")
+                        self._set_status(f"Session stopped: {reason}")
+                elif self._last_status.strip() == "":
+                    self._set_status("Ready")
         except Exception:
             pass
-        finally:
-            self.root.after(800, self._schedule_status_refresh)
@@ -2,7 +2,6 @@ from pathlib import Path
 import os
 import shutil
 import sys
-import time
 import tkinter as tk
 from tkinter import ttk
 
@@ -23,15 +22,36 @@ def _runtime_roots() -> tuple[Path, Path]:
     return project_root, project_root
 
 
+# Folder name -> whether seeded files may be hardlinked. Only profiles are safe to
+# share with the install directory because settings are saved via os.replace; the
+# journal and license files are rewritten in place.
+_SEED_FOLDERS = {"profiles": True, "licenses": False, "data": False}
+
+
+def _seed_tree(src: Path, dst: Path, hardlink: bool) -> None:
+    for dirpath, _dirnames, filenames in os.walk(src):
+        target_dir = dst / os.path.relpath(dirpath, src)
+        os.makedirs(target_dir, exist_ok=True)
+        for filename in filenames:
+            src_file = os.path.join(dirpath, filename)
+            dst_file = target_dir / filename
+            if hardlink:
+                try:
+                    os.link(src_file, dst_file)
+                    continue
+                except OSError:
+                    pass
+            shutil.copy2(src_file, dst_file)
+
+
 def _bootstrap_runtime_workspace(install_root: Path, workspace_root: Path) -> None:
-    folders_to_seed = ["profiles", "licenses", "data"]
-    for folder_name in folders_to_seed:
+    for folder_name, hardlink in _SEED_FOLDERS.items():
         src = install_root / folder_name
         dst = workspace_root / folder_name
         if dst.exists():
             continue
         if src.exists() and src.is_dir():
-            shutil.copytree(src, dst)
+            _seed_tree(src, dst, hardlink=hardlink)
         else:
             dst.mkdir(parents=True, exist_ok=True)
 
@@ -74,7 +94,9 @@ def _launch_with_splash(project_root: Path) -> BotController | None:
     if controller.settings.execution_mode == ExecutionMode.BROKER_PLUGIN:
         _set_loading(progress_var, status_var, 70, "Preparing Pocket Option", splash)
     _set_loading(progress_var, status_var, 100, "Launch complete", splash)
-    time.sleep(0.2)
+    # Keep processing window events while the final frame is shown.
+    splash.after(200, splash.quit)
+    splash.mainloop()
     splash.destroy()
     return controller
 
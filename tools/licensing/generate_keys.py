@@ -10,6 +10,17 @@ def main() -> None:
     project_root = Path(__file__).resolve().parents[2]
     licenses_dir = project_root / "licenses"
     licenses_dir.mkdir(parents=True, exist_ok=True)
+    private_path = licenses_dir / "private_key.pem"
+    public_path = licenses_dir / "public_key.pem"
+
+    if private_path.exists() and public_path.exists():
+        try:
+            serialization.load_pem_private_key(private_path.read_bytes(), password=None)
+        except (ValueError, TypeError):
+            pass
+        else:
+            print("Keys already present in licenses/, skipping generation")
+            return
 
     private_key = Ed25519PrivateKey.generate()
     public_key = private_key.public_key()
@@ -24,8 +35,8 @@ def main() -> None:
         format=serialization.PublicFormat.SubjectPublicKeyInfo,
     )
 
-    (licenses_dir / "private_key.pem").write_bytes(private_bytes)
-    (licenses_dir / "public_key.pem").write_bytes(public_bytes)
+    private_path.write_bytes(private_bytes)
+    public_path.write_bytes(public_bytes)
     print("Generated keys in licenses/: private_key.pem, public_key.pem")
 
 
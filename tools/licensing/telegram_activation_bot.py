@@ -1,12 +1,14 @@
 from __future__ import annotations
 
+import asyncio
 import base64
 import json
 import os
+from collections import deque
 from io import BytesIO
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from tempfile import TemporaryDirectory
 from uuid import uuid4
 
 from telegram import (
@@ -21,16 +23,25 @@ from telegram import (
     Update,
 )
 from telegram.ext import (
+    AIORateLimiter,
     Application,
     CallbackQueryHandler,
     CommandHandler,
     ContextTypes,
+    ExtBot,
     MessageHandler,
     PreCheckoutQueryHandler,
     filters,
 )
+from telegram.error import TelegramError
+from telegram.request import HTTPXRequest
 
-from bot.licensing.issuer import issue_device_license
+from bot.licensing.issuer import issue_device_license_bytes
+
+try:
+    import orjson
+except Exception:  # pragma: no cover
+    orjson = None
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -48,6 +59,9 @@ BTN_ADMIN_PENDING = "📋 Pending"
 BTN_ADMIN_ACTIVATE = "✅ Activate"
 BTN_ADMIN_REJECT = "⛔ Reject"
 
+_PENDING_STATUSES = frozenset({"pending_payment", "payment_submitted", "paid"})
+_PENDING_DISPLAY_LIMIT = 20
+
 
 def _load_dotenv_file() -> None:
     dotenv_path = PROJECT_ROOT / ".env"
@@ -72,16 +86,19 @@ def _env(name: str, default: str = "") -> str:
     return os.getenv(name, default).strip()
 
 
-def _admin_ids() -> set[int]:
+# Parsed on first use, which is after main() has loaded .env; the environment is not
+# changed afterwards.
+@lru_cache(maxsize=1)
+def _admin_ids() -> frozenset[int]:
     raw = _env("TELEGRAM_ADMIN_IDS")
     if not raw:
-        return set()
+        return frozenset()
     result: set[int] = set()
     for token in raw.split(","):
         token = token.strip()
         if token:
             result.add(int(token))
-    return result
+    return frozenset(result)
 
 
 def _payment_text() -> str:
@@ -125,17 +142,128 @@ def _payment_price_minors(default_value: int = 1000) -> int:
         return default_value
 
 
+@lru_cache(maxsize=1)
 def _auto_activate_on_payment() -> bool:
     return _env("TELEGRAM_AUTO_ACTIVATE_ON_PAYMENT", "true").lower() in {"1", "true", "yes", "on"}
 
 
+def _normalize_request_rows(data: dict) -> None:
+    # Older writers stored ids as strings; coerce once on load so handlers can compare directly.
+    for row in data.get("requests", []):
+        user_id = row.get("telegram_user_id")
+        if user_id is not None and not isinstance(user_id, int):
+            try:
+                row["telegram_user_id"] = int(user_id)
+            except (TypeError, ValueError):
+                pass
+        request_id = row.get("request_id")
+        if request_id is not None and not isinstance(request_id, str):
+            row["request_id"] = str(request_id)
+
+
+class _RequestStore:
+    # Keeps the parsed requests file in memory and only re-reads it when its stat changes,
+    # which also picks up edits made by the admin bot process. Saves are written through
+    # immediately for the same reason: a deferred flush could overwrite the other process.
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._stat_key: tuple[int, int] | None = None
+        self._data: dict = {"requests": []}
+        self._by_id: dict[str, dict] | None = None
+        self._by_user: dict[int, list[dict]] = {}
+        self._recent_pending: deque[dict] = deque(maxlen=_PENDING_DISPLAY_LIMIT)
+        self._indexed_count = 0
+
+    def _current_stat_key(self) -> tuple[int, int] | None:
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def load(self) -> dict:
+        stat_key = self._current_stat_key()
+        if stat_key is None:
+            if self._stat_key is not None:
+                self._stat_key = None
+                self._reset({"requests": []})
+            return self._data
+        if stat_key != self._stat_key:
+            try:
+                raw = self.path.read_bytes()
+                data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+                _normalize_request_rows(data)
+            except Exception:
+                data = {"requests": []}
+            self._stat_key = stat_key
+            self._reset(data)
+        return self._data
+
+    def save(self, data: dict) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if orjson is not None:
+            self.path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            self.path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        self._stat_key = self._current_stat_key()
+        self._reset(data)
+
+    def find(self, data: dict, request_id: str) -> dict | None:
+        if not self._ensure_index(data):
+            for item in data.get("requests", []):
+                if item.get("request_id") == request_id:
+                    return item
+            return None
+        return self._by_id.get(request_id)
+
+    def user_rows(self, data: dict, user_id: int) -> list[dict]:
+        if not self._ensure_index(data):
+            return [r for r in data.get("requests", []) if int(r.get("telegram_user_id", 0)) == user_id]
+        return self._by_user.get(user_id, [])
+
+    def recent_pending_rows(self, data: dict) -> deque[dict]:
+        # Only the newest pending rows are ever shown, so the index keeps just those.
+        if not self._ensure_index(data):
+            return deque(
+                (r for r in data.get("requests", []) if r.get("status") in _PENDING_STATUSES),
+                maxlen=_PENDING_DISPLAY_LIMIT,
+            )
+        return self._recent_pending
+
+    def _ensure_index(self, data: dict) -> bool:
+        # Rows are only mutated right before a save, which resets the index; appends are
+        # caught by the row count.
+        if data is not self._data:
+            return False
+        rows = data.get("requests", [])
+        if self._by_id is None or self._indexed_count != len(rows):
+            by_id: dict[str, dict] = {}
+            by_user: dict[int, list[dict]] = {}
+            recent_pending: deque[dict] = deque(maxlen=_PENDING_DISPLAY_LIMIT)
+            for row in rows:
+                by_id[row.get("request_id")] = row
+                by_user.setdefault(row.get("telegram_user_id", 0), []).append(row)
+                if row.get("status") in _PENDING_STATUSES:
+                    recent_pending.append(row)
+            self._by_id = by_id
+            self._by_user = by_user
+            self._recent_pending = recent_pending
+            self._indexed_count = len(rows)
+        return True
+
+    def _reset(self, data: dict) -> None:
+        self._data = data
+        self._by_id = None
+        self._by_user = {}
+        self._recent_pending = deque(maxlen=_PENDING_DISPLAY_LIMIT)
+        self._indexed_count = 0
+
+
+_request_store = _RequestStore(REQUESTS_PATH)
+
+
 def _load_requests() -> dict:
-    if not REQUESTS_PATH.exists():
-        return {"requests": []}
-    try:
-        return json.loads(REQUESTS_PATH.read_text(encoding="utf-8"))
-    except Exception:
-        return {"requests": []}
+    return _request_store.load()
 
 
 def _load_client_registry() -> dict:
@@ -153,8 +281,7 @@ def _save_client_registry(data: dict) -> None:
 
 
 def _save_requests(data: dict) -> None:
-    REQUESTS_PATH.parent.mkdir(parents=True, exist_ok=True)
-    REQUESTS_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    _request_store.save(data)
 
 
 def _new_request_id() -> str:
@@ -170,14 +297,11 @@ def _is_draft_device_id(device_id: str) -> bool:
 
 
 def _find_request(data: dict, request_id: str) -> dict | None:
-    for item in data.get("requests", []):
-        if item.get("request_id") == request_id:
-            return item
-    return None
+    return _request_store.find(data, request_id)
 
 
 def _latest_user_request(data: dict, user_id: int, statuses: set[str] | None = None) -> dict | None:
-    rows = [r for r in data.get("requests", []) if int(r.get("telegram_user_id", 0)) == user_id]
+    rows = _request_store.user_rows(data, user_id)
     if statuses is not None:
         rows = [r for r in rows if str(r.get("status", "")) in statuses]
     if not rows:
@@ -212,6 +336,8 @@ def _payment_payload(request_id: str, user_id: int) -> str:
     return f"license:{request_id}:{user_id}"
 
 
+# The pre-checkout query and the successful-payment update carry the same payload.
+@lru_cache(maxsize=1024)
 def _parse_payment_payload(payload: str) -> tuple[str, int] | None:
     parts = (payload or "").split(":")
     if len(parts) != 3 or parts[0] != "license":
@@ -227,15 +353,11 @@ def _find_user_request_for_payment(data: dict, user_id: int, request_id: str = "
         row = _find_request(data, request_id)
         if row is None:
             return None
-        if int(row.get("telegram_user_id", 0)) != int(user_id):
+        if row.get("telegram_user_id", 0) != int(user_id):
             return None
         return row
 
-    user_rows = [
-        r
-        for r in data.get("requests", [])
-        if int(r.get("telegram_user_id", 0)) == int(user_id) and r.get("status") in {"pending_payment", "payment_submitted", "paid"}
-    ]
+    user_rows = [r for r in _request_store.user_rows(data, int(user_id)) if r.get("status") in _PENDING_STATUSES]
     if not user_rows:
         return None
     return user_rows[-1]
@@ -251,8 +373,7 @@ def _manual_payment_text(request_id: str) -> str:
 
 
 def _is_admin(user_id: int) -> bool:
-    admins = _admin_ids()
-    return user_id in admins
+    return user_id in _admin_ids()
 
 
 def _admin_bot_token() -> str:
@@ -262,6 +383,25 @@ def _admin_bot_token() -> str:
     return _env("TELEGRAM_BOT_TOKEN")
 
 
+# Both bots send through AIORateLimiter, which keeps them under Telegram's global and
+# per-chat limits and, on a 429, pauses every pending send for the shared retry_after.
+_SEND_MAX_RETRIES = 3
+
+_admin_bot_instance: ExtBot | None = None
+
+
+def _admin_bot() -> ExtBot:
+    # One client for all admin notifications, so its HTTP connection pool is reused.
+    global _admin_bot_instance
+    if _admin_bot_instance is None:
+        _admin_bot_instance = ExtBot(
+            token=_admin_bot_token(),
+            request=HTTPXRequest(connection_pool_size=32, read_timeout=15, write_timeout=15, pool_timeout=1),
+            rate_limiter=AIORateLimiter(max_retries=_SEND_MAX_RETRIES),
+        )
+    return _admin_bot_instance
+
+
 def _decode_start_device(payload: str) -> tuple[str | None, str | None]:
     if payload.startswith("actj_"):
         token = payload[5:].strip()
@@ -301,36 +441,34 @@ def _create_activation_request(
     source: str = "user",
     client_id: str | None = None,
     device_model: str | None = None,
-) -> str:
+) -> tuple[str, dict]:
     data = _load_requests()
     request_id = _new_request_id()
     now_iso = datetime.now(timezone.utc).isoformat()
     resolved_client_id = client_id or _get_or_create_client_id(user_id=user_id, device_id=device_id)
-    data.setdefault("requests", []).append(
-        {
-            "request_id": request_id,
-            "telegram_user_id": user_id,
-            "telegram_username": username,
-            "device_id": device_id,
-            "device_model": device_model or "",
-            "client_id": resolved_client_id,
-            "status": "pending_payment",
-            "created_at": now_iso,
-            "updated_at": now_iso,
-            "paid_at": None,
-            "activated_at": None,
-            "expires_at": None,
-            "admin_note": "",
-            "source": source,
-        }
-    )
+    row = {
+        "request_id": request_id,
+        "telegram_user_id": user_id,
+        "telegram_username": username,
+        "device_id": device_id,
+        "device_model": device_model or "",
+        "client_id": resolved_client_id,
+        "status": "pending_payment",
+        "created_at": now_iso,
+        "updated_at": now_iso,
+        "paid_at": None,
+        "activated_at": None,
+        "expires_at": None,
+        "admin_note": "",
+        "source": source,
+    }
+    data.setdefault("requests", []).append(row)
     _save_requests(data)
-    return request_id
+    return request_id, row
 
 
 def _latest_known_user_device_id(user_id: int) -> str | None:
-    data = _load_requests()
-    rows = [r for r in data.get("requests", []) if int(r.get("telegram_user_id", 0)) == user_id]
+    rows = _request_store.user_rows(_load_requests(), user_id)
     if not rows:
         registry = _load_client_registry()
         client_rows = [r for r in registry.get("clients", []) if int(r.get("telegram_user_id", 0)) == user_id]
@@ -393,26 +531,76 @@ def _create_request_options_keyboard(has_linked_device: bool) -> InlineKeyboardM
     return InlineKeyboardMarkup(rows)
 
 
+# Telegram markup objects are immutable, so both variants are built once.
+_CREATE_REQUEST_KEYBOARDS = {
+    True: _create_request_options_keyboard(has_linked_device=True),
+    False: _create_request_options_keyboard(has_linked_device=False),
+}
+
+
+async def _safe_send(bot: Bot, chat_id: int, text: str, **kwargs) -> None:
+    try:
+        await bot.send_message(chat_id=chat_id, text=text, **kwargs)
+    except TelegramError:
+        pass
+
+
+async def _broadcast_to_admins(bot: Bot, text: str, **kwargs) -> None:
+    # Admins are notified concurrently so K admins cost one round trip, not K.
+    await asyncio.gather(*(_safe_send(bot, admin_id, text, **kwargs) for admin_id in _admin_ids()))
+
+
+class _AdminDigest:
+    # Collects short status lines for admins and sends them as one message per flush, so a
+    # payment that is detected and then activated costs one send per admin instead of two.
+    def __init__(self, delay_s: float = 2.0, max_chars: int = 4000) -> None:
+        self.delay_s = delay_s
+        self.max_chars = max_chars
+        self._lines: list[str] = []
+        self._flush_task: asyncio.Task | None = None
+
+    def add(self, line: str) -> None:
+        self._lines.append(line)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        # Lines added while a batch is being sent are picked up by the next pass.
+        while self._lines:
+            await asyncio.sleep(self.delay_s)
+            lines, self._lines = self._lines, []
+            chunk = ""
+            for line in lines:
+                if chunk and len(chunk) + 1 + len(line) > self.max_chars:
+                    await _broadcast_to_admins(_admin_bot(), chunk)
+                    chunk = ""
+                chunk = f"{chunk}\n{line}" if chunk else line[: self.max_chars]
+            if chunk:
+                await _broadcast_to_admins(_admin_bot(), chunk)
+
+
+_admin_digest = _AdminDigest()
+
+# Bounds how many payment-triggered activations run at once.
+_auto_activation_slots = asyncio.Semaphore(4)
+
+
 async def _notify_admins_new_request(context: ContextTypes.DEFAULT_TYPE, request_id: str, user_id: int, username: str, device_id: str, source: str = "user") -> None:
-    admin_bot = Bot(token=_admin_bot_token())
+    admin_bot = _admin_bot()
     data = _load_requests()
     row = _find_request(data, request_id)
     client_id = str(row.get("client_id", "")).strip() if row else ""
-    for admin_id in _admin_ids():
-        try:
-            await admin_bot.send_message(
-                chat_id=admin_id,
-                text=(
-                    f"New activation request ({source})\n"
-                    f"Request ID: {request_id}\n"
-                    f"Client ID: {client_id or '-'}\n"
-                    f"User: @{username or 'unknown'} ({user_id})\n"
-                    f"Device: {device_id}"
-                ),
-                reply_markup=_admin_request_actions(request_id),
-            )
-        except Exception:
-            pass
+    await _broadcast_to_admins(
+        admin_bot,
+        (
+            f"New activation request ({source})\n"
+            f"Request ID: {request_id}\n"
+            f"Client ID: {client_id or '-'}\n"
+            f"User: @{username or 'unknown'} ({user_id})\n"
+            f"Device: {device_id}"
+        ),
+        reply_markup=_admin_request_actions(request_id),
+    )
 
 
 async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -423,17 +611,14 @@ async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     if context.args:
         device_id, device_model = _decode_start_device(context.args[0].strip())
         if device_id:
-            request_id = _create_activation_request(
+            request_id, row = _create_activation_request(
                 user_id=user.id,
                 username=user.username or "",
                 device_id=device_id,
                 source="desktop_redirect",
                 device_model=device_model,
             )
-
-            data = _load_requests()
-            row = _find_request(data, request_id)
-            client_id = str(row.get("client_id", "")).strip() if row else ""
+            client_id = str(row.get("client_id", "")).strip()
 
             pay_keyboard = InlineKeyboardMarkup(
                 [[InlineKeyboardButton(text="Pay Now", callback_data=f"pay:{request_id}")]]
@@ -590,7 +775,7 @@ async def cmd_submit_payment(update: Update, context: ContextTypes.DEFAULT_TYPE)
         request_id = str(row.get("request_id", "")).strip()
 
     row = _find_request(data, request_id)
-    if row is None or int(row.get("telegram_user_id", 0)) != update.effective_user.id:
+    if row is None or row.get("telegram_user_id", 0) != update.effective_user.id:
         await update.message.reply_text("Request not found for your account.")
         return
 
@@ -611,7 +796,7 @@ async def on_payment_proof_message(update: Update, context: ContextTypes.DEFAULT
 
     data = _load_requests()
     row = _find_request(data, request_id)
-    if row is None or int(row.get("telegram_user_id", 0)) != update.effective_user.id:
+    if row is None or row.get("telegram_user_id", 0) != update.effective_user.id:
         context.user_data.pop("awaiting_payment_proof_request_id", None)
         return
 
@@ -658,7 +843,7 @@ async def on_payment_proof_message(update: Update, context: ContextTypes.DEFAULT
         f"Note: {note or '-'}"
     )
 
-    admin_bot = Bot(token=_admin_bot_token())
+    admin_bot = _admin_bot()
     for admin_id in _admin_ids():
         try:
             if proof_type in {"photo", "document"} and proof_file_id:
@@ -699,7 +884,7 @@ async def on_payment_proof_message(update: Update, context: ContextTypes.DEFAULT
                     text=admin_text,
                     reply_markup=_admin_request_actions(request_id),
                 )
-            except Exception:
+            except TelegramError:
                 pass
 
 
@@ -806,15 +991,13 @@ async def on_create_callback(update: Update, context: ContextTypes.DEFAULT_TYPE)
             await query.answer("No linked device found", show_alert=True)
             return
         await query.answer()
-        request_id = _create_activation_request(
+        request_id, row = _create_activation_request(
             user_id=update.effective_user.id,
             username=update.effective_user.username or "",
             device_id=device_id,
             source="create_linked",
         )
-        data = _load_requests()
-        row = _find_request(data, request_id)
-        client_id = str(row.get("client_id", "")).strip() if row else ""
+        client_id = str(row.get("client_id", "")).strip()
         pay_keyboard = InlineKeyboardMarkup(
             [[InlineKeyboardButton(text="Pay Now", callback_data=f"pay:{request_id}")]]
         )
@@ -895,10 +1078,10 @@ async def on_admin_action_callback(update: Update, context: ContextTypes.DEFAULT
         await context.bot.send_message(chat_id=update.effective_user.id, text=f"Rejected: {request_id}")
         try:
             await context.bot.send_message(
-                chat_id=int(row.get("telegram_user_id")),
+                chat_id=row["telegram_user_id"],
                 text=f"Your activation request {request_id} was rejected.",
             )
-        except Exception:
+        except TelegramError:
             pass
 
 
@@ -917,47 +1100,44 @@ async def _activate_and_send_license_by_request_id(
 
     effective_days = days if days is not None else _license_days()
 
-    with TemporaryDirectory() as tmp_dir:
-        out_path = Path(tmp_dir) / f"license_{request_id}.json"
-        try:
-            license_path, expires_at = issue_device_license(
-                project_root=PROJECT_ROOT,
-                device_id=str(row.get("device_id", "")),
-                customer=str(row.get("telegram_user_id", "customer")),
-                client_id=str(row.get("client_id", "")).strip() or None,
-                days=effective_days,
-                out_path=out_path,
-            )
-        except Exception as exc:
-            return False, f"Activation failed: {exc}"
+    try:
+        license_bytes, expires_at = issue_device_license_bytes(
+            project_root=PROJECT_ROOT,
+            device_id=str(row.get("device_id", "")),
+            customer=str(row.get("telegram_user_id", "customer")),
+            client_id=str(row.get("client_id", "")).strip() or None,
+            days=effective_days,
+        )
+    except Exception as exc:
+        return False, f"Activation failed: {exc}"
 
-        row["status"] = "activated"
-        row["activated_at"] = datetime.now(timezone.utc).isoformat()
-        row["updated_at"] = row["activated_at"]
-        row["expires_at"] = expires_at
-        _save_requests(data)
+    row["status"] = "activated"
+    row["activated_at"] = datetime.now(timezone.utc).isoformat()
+    row["updated_at"] = row["activated_at"]
+    row["expires_at"] = expires_at
+    _save_requests(data)
 
-        target_chat_id = int(row.get("telegram_user_id"))
-        caption = (
-            f"Your license is activated.\n"
-            f"Request ID: {request_id}\n"
-            f"Expires at: {expires_at}\n\n"
-            "Save this as licenses/license.json in your bot folder."
-        )
+    target_chat_id = row["telegram_user_id"]
+    caption = (
+        f"Your license is activated.\n"
+        f"Request ID: {request_id}\n"
+        f"Expires at: {expires_at}\n\n"
+        "Save this as licenses/license.json in your bot folder."
+    )
 
-        try:
-            with license_path.open("rb") as file_obj:
-                await context.bot.send_document(chat_id=target_chat_id, document=file_obj, filename="license.json", caption=caption)
-        except Exception as exc:
-            return False, f"Activated but failed to send file: {exc}"
+    try:
+        await context.bot.send_document(
+            chat_id=target_chat_id,
+            document=BytesIO(license_bytes),
+            filename="license.json",
+            caption=caption,
+        )
+    except Exception as exc:
+        return False, f"Activated but failed to send file: {exc}"
 
-        for admin_id in _admin_ids():
-            try:
-                await context.bot.send_message(chat_id=admin_id, text=f"License activated and sent: {request_id}")
-            except Exception:
-                pass
+    _admin_digest.add(f"License activated and sent: {request_id}")
 
-        return True, f"Activated and sent license: {request_id}"
+    return True, f"Activated and sent license: {request_id}"
 
 
 async def on_precheckout_query(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -973,7 +1153,7 @@ async def on_precheckout_query(update: Update, context: ContextTypes.DEFAULT_TYP
     request_id, user_id = parsed
     data = _load_requests()
     row = _find_request(data, request_id)
-    if row is None or int(row.get("telegram_user_id", 0)) != user_id:
+    if row is None or row.get("telegram_user_id", 0) != user_id:
         await query.answer(ok=False, error_message="Activation request not found")
         return
 
@@ -1008,19 +1188,21 @@ async def on_successful_payment(update: Update, context: ContextTypes.DEFAULT_TY
 
     await update.message.reply_text(f"Payment detected for request {request_id}.")
 
-    admin_bot = Bot(token=_admin_bot_token())
-    for admin_id in _admin_ids():
-        try:
-            await admin_bot.send_message(chat_id=admin_id, text=f"Payment auto-detected for request {request_id}")
-        except Exception:
-            pass
+    _admin_digest.add(f"Payment auto-detected for request {request_id}")
 
     if _auto_activate_on_payment():
+        # Activation signs and uploads the license; run it as an application task so this
+        # update returns as soon as the payment is acknowledged.
+        context.application.create_task(_auto_activate_after_payment(update, context, request_id), update=update)
+
+
+async def _auto_activate_after_payment(update: Update, context: ContextTypes.DEFAULT_TYPE, request_id: str) -> None:
+    async with _auto_activation_slots:
         ok, message = await _activate_and_send_license_by_request_id(request_id, context=context)
-        if ok:
-            await update.message.reply_text("License has been activated and sent to you.")
-        else:
-            await update.message.reply_text(f"Payment received; activation pending admin action. {message}")
+    if ok:
+        await update.message.reply_text("License has been activated and sent to you.")
+    else:
+        await update.message.reply_text(f"Payment received; activation pending admin action. {message}")
 
 
 async def cmd_my_requests(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1028,17 +1210,26 @@ async def cmd_my_requests(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
         return
 
     data = _load_requests()
-    rows = [r for r in data.get("requests", []) if r.get("telegram_user_id") == update.effective_user.id]
+    rows = _request_store.user_rows(data, update.effective_user.id)
     if not rows:
         await update.message.reply_text("No requests found.")
         return
 
-    lines = []
-    for row in rows[-10:]:
-        lines.append(
+    await update.message.reply_text(
+        "\n".join(
             f"{row.get('request_id')} | {row.get('status')} | device={row.get('device_id')} | exp={row.get('expires_at') or '-'}"
+            for row in rows[-10:]
         )
-    await update.message.reply_text("\n".join(lines))
+    )
+
+
+_MENU_DISPATCH = {
+    BTN_PAY: cmd_pay,
+    BTN_MY: cmd_my_requests,
+    BTN_PROOF: cmd_submit_payment,
+    BTN_DEVICE: cmd_device_id,
+    BTN_HELP: cmd_help,
+}
 
 
 async def on_text_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1061,15 +1252,13 @@ async def on_text_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             )
             return
 
-        request_id = _create_activation_request(
+        request_id, row = _create_activation_request(
             user_id=update.effective_user.id,
             username=update.effective_user.username or "",
             device_id=device_id,
             source="manual_text",
         )
-        data = _load_requests()
-        row = _find_request(data, request_id)
-        client_id = str(row.get("client_id", "")).strip() if row else ""
+        client_id = str(row.get("client_id", "")).strip()
         pay_keyboard = InlineKeyboardMarkup(
             [[InlineKeyboardButton(text="Pay Now", callback_data=f"pay:{request_id}")]]
         )
@@ -1099,24 +1288,12 @@ async def on_text_menu(update: Update, context: ContextTypes.DEFAULT_TYPE) -> No
             "Create request options:\n"
             "- Use linked device ID\n"
             "- Enter new device ID",
-            reply_markup=_create_request_options_keyboard(has_linked_device=has_linked_device),
+            reply_markup=_CREATE_REQUEST_KEYBOARDS[has_linked_device],
         )
         return
-    if text == BTN_PAY:
-        await cmd_pay(update, context)
-        return
-    if text == BTN_MY:
-        await cmd_my_requests(update, context)
-        return
-    if text == BTN_PROOF:
-        await cmd_submit_payment(update, context)
-        return
-    if text == BTN_DEVICE:
-        await cmd_device_id(update, context)
-        return
-    if text == BTN_HELP:
-        await cmd_help(update, context)
-        return
+    handler = _MENU_DISPATCH.get(text)
+    if handler is not None:
+        await handler(update, context)
 
 
 async def cmd_pending(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1127,17 +1304,17 @@ async def cmd_pending(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Non
         return
 
     data = _load_requests()
-    rows = [r for r in data.get("requests", []) if r.get("status") in {"pending_payment", "payment_submitted", "paid"}]
+    rows = _request_store.recent_pending_rows(data)
     if not rows:
         await update.message.reply_text("No pending requests.")
         return
 
-    lines = []
-    for row in rows[-20:]:
-        lines.append(
+    await update.message.reply_text(
+        "\n".join(
             f"{row.get('request_id')} | {row.get('status')} | user={row.get('telegram_user_id')} | device={row.get('device_id')}"
+            for row in rows
         )
-    await update.message.reply_text("\n".join(lines))
+    )
 
 
 async def cmd_paid(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -1214,8 +1391,8 @@ async def cmd_reject(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
     await update.message.reply_text(f"Rejected: {request_id}")
 
     try:
-        await context.bot.send_message(chat_id=int(row.get("telegram_user_id")), text=f"Your activation request {request_id} was rejected.\nReason: {reason}")
-    except Exception:
+        await context.bot.send_message(chat_id=row["telegram_user_id"], text=f"Your activation request {request_id} was rejected.\nReason: {reason}")
+    except TelegramError:
         pass
 
 
@@ -1240,7 +1417,18 @@ def main() -> None:
         ]
         await application.bot.set_my_commands(user_commands, scope=BotCommandScopeAllPrivateChats())
 
-    app = Application.builder().token(token).post_init(_post_init).build()
+    app = (
+        Application.builder()
+        .token(token)
+        .connection_pool_size(64)
+        .read_timeout(15)
+        .write_timeout(15)
+        .pool_timeout(1)
+        .rate_limiter(AIORateLimiter(max_retries=_SEND_MAX_RETRIES))
+        .concurrent_updates(True)
+        .post_init(_post_init)
+        .build()
+    )
     app.add_handler(CommandHandler("start", cmd_start))
     app.add_handler(CommandHandler("help", cmd_help))
     app.add_handler(CommandHandler("device_id", cmd_device_id))
@@ -1260,8 +1448,26 @@ def main() -> None:
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, on_text_menu))
     app.add_handler(MessageHandler(filters.SUCCESSFUL_PAYMENT, on_successful_payment))
 
+    webhook_url = _env("TELEGRAM_WEBHOOK_URL")
+    if webhook_url:
+        # Telegram pushes updates to us, so there is no getUpdates round trip per batch.
+        # Every update must carry the secret header; the path itself is not a secret.
+        webhook_secret = _env("TELEGRAM_WEBHOOK_SECRET")
+        if not webhook_secret:
+            raise RuntimeError("Missing TELEGRAM_WEBHOOK_SECRET (required when TELEGRAM_WEBHOOK_URL is set)")
+        url_path = _env("TELEGRAM_WEBHOOK_PATH", "telegram").strip("/")
+        print("Telegram activation bot running (webhook)...")
+        app.run_webhook(
+            listen=_env("TELEGRAM_WEBHOOK_LISTEN", "127.0.0.1"),
+            port=int(_env("TELEGRAM_WEBHOOK_PORT", "8443")),
+            url_path=url_path,
+            webhook_url=f"{webhook_url.rstrip('/')}/{url_path}",
+            secret_token=webhook_secret,
+        )
+        return
+
     print("Telegram activation bot running...")
-    app.run_polling()
+    app.run_polling(poll_interval=0.0, timeout=30)
 
 
 if __name__ == "__main__":
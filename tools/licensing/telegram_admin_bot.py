@@ -3,8 +3,8 @@ from __future__ import annotations
 import json
 import os
 from datetime import datetime, timezone
+from io import BytesIO
 from pathlib import Path
-from tempfile import TemporaryDirectory
 
 from telegram import (
     BotCommand,
@@ -17,7 +17,7 @@ from telegram import (
 )
 from telegram.ext import Application, CallbackQueryHandler, CommandHandler, ContextTypes
 
-from bot.licensing.issuer import issue_device_license
+from bot.licensing.issuer import issue_device_license_bytes
 
 
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
@@ -181,43 +181,39 @@ async def _activate_and_send(context: ContextTypes.DEFAULT_TYPE, request_id: str
 
     effective_days = days if days is not None else _license_days()
 
-    with TemporaryDirectory() as tmp_dir:
-        out_path = Path(tmp_dir) / f"license_{request_id}.json"
-        try:
-            license_path, expires_at = issue_device_license(
-                project_root=PROJECT_ROOT,
-                device_id=str(row.get("device_id", "")),
-                customer=str(row.get("telegram_user_id", "customer")),
-                client_id=str(row.get("client_id", "")).strip() or None,
-                days=effective_days,
-                out_path=out_path,
-            )
-        except Exception as exc:
-            return False, f"Activation failed: {exc}"
-
-        row["status"] = "activated"
-        row["activated_at"] = datetime.now(timezone.utc).isoformat()
-        row["updated_at"] = row["activated_at"]
-        row["expires_at"] = expires_at
-        _save_requests(data)
-
-        caption = (
-            f"Your license is activated.\n"
-            f"Request ID: {request_id}\n"
-            f"Expires at: {expires_at}\n\n"
-            "Save this as licenses/license.json in your bot folder."
+    try:
+        license_bytes, expires_at = issue_device_license_bytes(
+            project_root=PROJECT_ROOT,
+            device_id=str(row.get("device_id", "")),
+            customer=str(row.get("telegram_user_id", "customer")),
+            client_id=str(row.get("client_id", "")).strip() or None,
+            days=effective_days,
         )
+    except Exception as exc:
+        return False, f"Activation failed: {exc}"
 
-        try:
-            with license_path.open("rb") as file_obj:
-                await context.bot.send_document(
-                    chat_id=int(row.get("telegram_user_id")),
-                    document=file_obj,
-                    filename="license.json",
-                    caption=caption,
-                )
-        except Exception as exc:
-            return False, f"Activated but failed to send file: {exc}"
+    row["status"] = "activated"
+    row["activated_at"] = datetime.now(timezone.utc).isoformat()
+    row["updated_at"] = row["activated_at"]
+    row["expires_at"] = expires_at
+    _save_requests(data)
+
+    caption = (
+        f"Your license is activated.\n"
+        f"Request ID: {request_id}\n"
+        f"Expires at: {expires_at}\n\n"
+        "Save this as licenses/license.json in your bot folder."
+    )
+
+    try:
+        await context.bot.send_document(
+            chat_id=int(row.get("telegram_user_id")),
+            document=BytesIO(license_bytes),
+            filename="license.json",
+            caption=caption,
+        )
+    except Exception as exc:
+        return False, f"Activated but failed to send file: {exc}"
 
     return True, f"Activated and sent license: {request_id}"
 